@@ -2,19 +2,29 @@
 
 DEFAULT_VALIDATORS_COUNT = 5
 DEFAULT_CONSENSUS_SLEEP_TIME = 5
+MAX_CONCURRENT_APPEAL_WINDOW_TASKS = 16
+DEFAULT_MAX_CONCURRENT_PENDING_TRANSACTIONS = 8
+PENDING_TRANSACTIONS_BATCH_SIZE = 100
+PENDING_QUEUE_IDLE_TIMEOUT = 600
+APPEAL_FAILED_MESSAGE = "Appeal failed, no validators found to process the appeal"
+APPEAL_UPDATED_MESSAGE = "Set transaction appealed"
 
 import os
 import asyncio
 import traceback
-from typing import Callable, List, Iterable, Literal
+from typing import Awaitable, Callable, List, Iterable, Literal
 import time
 from abc import ABC, abstractmethod
 import threading
 import random
 from copy import deepcopy
+from enum import Enum
+from functools import lru_cache, partial
+from itertools import chain
 import json
 import base64
 
+from eth_utils.crypto import keccak
 from sqlalchemy.orm import Session
 from backend.consensus.vrf import get_validators_for_transaction
 from backend.database_handler.chain_snapshot import ChainSnapshot
@@ -32,8 +42,9 @@ from backend.domain.types import (
     LLMProvider,
     Validator,
 )
-from backend.node.base import Node
+from backend.node.base import Node, SIMULATOR_CHAIN_ID
 from backend.node.types import (
+    Address,
     ExecutionMode,
     Receipt,
     Vote,
@@ -51,6 +62,36 @@ from backend.rollup.consensus_service import ConsensusService
 import backend.validators as validators
 from backend.database_handler.validators_registry import ValidatorsRegistry
 
+# Status value compared against for every transaction of the appeal window queues
+FINALIZED_STATUS = TransactionStatus.FINALIZED.value
+
+# Statuses of a transaction the pending queue consumer is still executing
+IN_PROCESS_STATUSES = (
+    TransactionStatus.ACTIVATED.value,
+    TransactionStatus.PROPOSING.value,
+    TransactionStatus.COMMITTING.value,
+    TransactionStatus.REVEALING.value,
+)
+
+# Chain id part of the address preimage of salted contract deployments
+SIMULATOR_CHAIN_ID_BYTES = SIMULATOR_CHAIN_ID.to_bytes(32, "big", signed=False)
+
+# Constant parts of the events sent when an appeal fails
+APPEAL_FAILED_EVENT = partial(
+    LogEvent,
+    "consensus_event",
+    EventType.ERROR,
+    EventScope.CONSENSUS,
+    APPEAL_FAILED_MESSAGE,
+)
+APPEAL_UPDATED_EVENT = partial(
+    LogEvent,
+    "transaction_appeal_updated",
+    EventType.INFO,
+    EventScope.CONSENSUS,
+    APPEAL_UPDATED_MESSAGE,
+)
+
 type NodeFactory = Callable[
     [
         dict,
@@ -88,13 +129,12 @@ def node_factory(
     Returns:
         Node: A new Node instance.
     """
-    # Create a node instance with the provided parameters
-    return Node(
-        contract_snapshot=contract_snapshot,
-        validator_mode=validator_mode,
-        leader_receipt=leader_receipt,
-        msg_handler=msg_handler,
-        validator=Validator(
+    # A validator is usually a node several times per transaction (rotations, appeals), it is only built once per snapshot
+    node_validator = validators_manager_snapshot.node_validators.get(
+        validator["address"]
+    )
+    if node_validator is None:
+        node_validator = Validator(
             address=validator["address"],
             private_key=validator["private_key"],
             stake=validator["stake"],
@@ -105,7 +145,18 @@ def node_factory(
                 plugin=validator["plugin"],
                 plugin_config=validator["plugin_config"],
             ),
-        ),
+        )
+        validators_manager_snapshot.node_validators[validator["address"]] = (
+            node_validator
+        )
+
+    # Create a node instance with the provided parameters
+    return Node(
+        contract_snapshot=contract_snapshot,
+        validator_mode=validator_mode,
+        leader_receipt=leader_receipt,
+        msg_handler=msg_handler,
+        validator=node_validator,
         contract_snapshot_factory=contract_snapshot_factory,
         validators_snapshot=validators_manager_snapshot,
     )
@@ -201,20 +252,48 @@ class TransactionContext:
         transactions_processor (TransactionsProcessor): Instance responsible for handling transaction operations within the database.
         chain_snapshot (ChainSnapshot): Snapshot of the chain state.
         accounts_manager (AccountsManager): Manager for accounts.
-        contract_snapshot_factory (Callable[[str], ContractSnapshot]): Factory function to create contract snapshots.
+        contract_snapshot_factory (Callable[[str], ContractSnapshot]): Factory function to create contract snapshots, memoized per contract address.
         node_factory (Callable[[dict, ExecutionMode, ContractSnapshot, Receipt | None, MessageHandler, Callable[[str], ContractSnapshot]], Node]): Factory function to create nodes.
         msg_handler (MessageHandler): Handler for messaging.
         consensus_data (ConsensusData): Data related to the consensus process.
         iterator_rotation (Iterator[list] | None): Iterator for rotating validators.
         remaining_validators (list): List of remaining validators.
         num_validators (int): Number of validators.
-        contract_snapshot (ContractSnapshot | None): Snapshot of the contract state.
+        contract_snapshot (ContractSnapshot | None): Snapshot of the contract state, loaded on first access when the transaction does not carry one.
         votes (dict): Dictionary of votes.
         validator_nodes (list): List of validator nodes.
         validation_results (list): List of validation results.
         consensus_service (ConsensusService): Consensus service to interact with the rollup.
+        validators_snapshot (validators.Snapshot | None): Snapshot of the validators.
+        all_validators (list[dict] | None): All validators of the validators snapshot, built once per transaction on first access.
     """
 
+    __slots__ = (
+        "transaction",
+        "transactions_processor",
+        "chain_snapshot",
+        "accounts_manager",
+        "contract_snapshot_factory",
+        "contract_processor",
+        "node_factory",
+        "msg_handler",
+        "consensus_data",
+        "involved_validators",
+        "remaining_validators",
+        "num_validators",
+        "votes",
+        "validator_nodes",
+        "validation_results",
+        "rotation_count",
+        "consensus_service",
+        "leader",
+        "_contract_snapshot",
+        "validators_snapshot",
+        "_all_validators",
+        "_validators_by_address",
+        "not_used_validators",
+    )
+
     def __init__(
         self,
         transaction: Transaction,
@@ -245,7 +324,10 @@ class TransactionContext:
         self.transactions_processor = transactions_processor
         self.chain_snapshot = chain_snapshot
         self.accounts_manager = accounts_manager
-        self.contract_snapshot_factory = contract_snapshot_factory
+        # Every node of the transaction reads the same contracts, so each one is only loaded once
+        self.contract_snapshot_factory = lru_cache(maxsize=None)(
+            contract_snapshot_factory
+        )
         self.contract_processor = contract_processor
         self.node_factory = node_factory
         self.msg_handler = msg_handler
@@ -262,15 +344,53 @@ class TransactionContext:
         self.consensus_service = consensus_service
         self.leader: dict = {}
 
-        if self.transaction.type != TransactionType.SEND:
-            if self.transaction.contract_snapshot:
-                self.contract_snapshot = self.transaction.contract_snapshot
-            else:
-                self.contract_snapshot = self.contract_snapshot_factory(
-                    self.transaction.to_address
-                )
+        self._contract_snapshot: ContractSnapshot | None = (
+            self.transaction.contract_snapshot
+            if self.transaction.type != TransactionType.SEND
+            else None
+        )
 
         self.validators_snapshot = validators_snapshot
+        self._all_validators: list[dict] | None = None
+        self._validators_by_address: dict[str, dict] | None = None
+        self.not_used_validators: list[dict] | None = None
+
+    @property
+    def contract_snapshot(self) -> ContractSnapshot | None:
+        """
+        Snapshot of the contract state. It is only loaded when a state needs it, finalization never does.
+        """
+        if (
+            self._contract_snapshot is None
+            and self.transaction.type != TransactionType.SEND
+        ):
+            self._contract_snapshot = self.contract_snapshot_factory(
+                self.transaction.to_address
+            )
+        return self._contract_snapshot
+
+    @property
+    def all_validators(self) -> list[dict] | None:
+        """
+        All validators of the validators snapshot. The list is only built on first access, so paths that
+        only need the number of validators can use len(validators_snapshot.nodes) without building it.
+        """
+        if self._all_validators is None and self.validators_snapshot is not None:
+            self._all_validators = [
+                n.validator.to_dict() for n in self.validators_snapshot.nodes
+            ]
+        return self._all_validators
+
+    @property
+    def validators_by_address(self) -> dict[str, dict] | None:
+        """
+        All validators of the validators snapshot indexed by address, built once per transaction.
+        """
+        if self._validators_by_address is None and self.all_validators is not None:
+            self._validators_by_address = {
+                validator["address"]: validator for validator in self.all_validators
+            }
+        return self._validators_by_address
 
 
 class ConsensusAlgorithm:
@@ -282,6 +402,8 @@ class ConsensusAlgorithm:
         msg_handler (MessageHandler): Handler for messaging.
         consensus_service (ConsensusService): Consensus service to interact with the rollup.
         pending_queues (dict[str, asyncio.Queue]): Dictionary of pending_queues for transactions.
+        appeal_window_semaphore (asyncio.Semaphore): Limits the number of contracts processed at the same time in the appeal window.
+        pending_transactions_semaphore (asyncio.Semaphore): Limits the number of pending transactions executed at the same time across all contracts.
         finality_window_time (int): Time in seconds for the finality window.
         consensus_sleep_time (int): Time in seconds for the consensus sleep time.
     """
@@ -305,6 +427,8 @@ class ConsensusAlgorithm:
         self.msg_handler = msg_handler
         self.consensus_service = consensus_service
         self.pending_queues: dict[str, asyncio.Queue] = {}
+        # Addresses of newly created pending queues, so their consumer is started without waiting for the next poll
+        self.new_pending_queue_addresses: asyncio.Queue[str] = asyncio.Queue()
         self.finality_window_time = int(os.environ["VITE_FINALITY_WINDOW"])
         self.finality_window_appeal_failed_reduction = float(
             os.environ["VITE_FINALITY_WINDOW_APPEAL_FAILED_REDUCTION"]
@@ -313,16 +437,26 @@ class ConsensusAlgorithm:
         self.pending_queue_stop_events: dict[str, asyncio.Event] = (
             {}
         )  # Events to stop tasks for each pending queue
-        self.pending_queue_task_running: dict[str, bool] = (
+        self.pending_queue_task_idle_events: dict[str, asyncio.Event] = (
             {}
-        )  # Track running state for each pending queue
+        )  # Set while the task of a pending queue is not executing a transaction
         self.validators_manager = validators_manager
+        # Contracts are processed concurrently in the appeal window, each task holds a database session
+        self.appeal_window_semaphore = asyncio.Semaphore(
+            MAX_CONCURRENT_APPEAL_WINDOW_TASKS
+        )
+        # Each pending queue has its own consumer, this bounds how many of them hold a session, LLM and web resources at once
+        self.pending_transactions_semaphore = asyncio.Semaphore(
+            int(
+                os.getenv(
+                    "CONSENSUS_MAX_CONCURRENCY",
+                    DEFAULT_MAX_CONCURRENT_PENDING_TRANSACTIONS,
+                )
+            )
+        )
 
     async def run_crawl_snapshot_loop(
         self,
-        chain_snapshot_factory: Callable[
-            [Session], ChainSnapshot
-        ] = chain_snapshot_factory,
         transactions_processor_factory: Callable[
             [Session], TransactionsProcessor
         ] = transactions_processor_factory,
@@ -332,25 +466,17 @@ class ConsensusAlgorithm:
         Run the loop to crawl snapshots.
 
         Args:
-            chain_snapshot_factory (Callable[[Session], ChainSnapshot]): Creates snapshots of the blockchain state at specific points in time.
             transactions_processor_factory (Callable[[Session], TransactionsProcessor]): Creates processors to modify transactions.
             stop_event (threading.Event): Control signal to terminate the loop.
         """
-        # Create a new event loop for crawling snapshots
-
         try:
-            await self._crawl_snapshot(
-                chain_snapshot_factory, transactions_processor_factory, stop_event
-            )
+            await self._crawl_snapshot(transactions_processor_factory, stop_event)
         except BaseException as e:
-            import traceback
-
             traceback.print_exception(e)
             raise
 
     async def _crawl_snapshot(
         self,
-        chain_snapshot_factory: Callable[[Session], ChainSnapshot],
         transactions_processor_factory: Callable[[Session], TransactionsProcessor],
         stop_event: threading.Event,
     ):
@@ -358,44 +484,142 @@ class ConsensusAlgorithm:
         Crawl snapshots and process pending transactions.
 
         Args:
-            chain_snapshot_factory (Callable[[Session], ChainSnapshot]): Creates snapshots of the blockchain state at specific points in time.
             transactions_processor_factory (Callable[[Session], TransactionsProcessor]): Creates processors to modify transactions.
             stop_event (threading.Event): Control signal to terminate the loop.
         """
-        while not stop_event.is_set():
-            with self.get_session() as session:
-                chain_snapshot = chain_snapshot_factory(session)
-                transactions_processor = transactions_processor_factory(session)
-                pending_transactions = chain_snapshot.get_pending_transactions()
-                for transaction in pending_transactions:
-                    transaction = Transaction.from_dict(transaction)
-                    address = transaction.to_address
+        pending_transactions_notified = asyncio.Event()
+        stop_listening = self._listen_for_pending_transactions(
+            pending_transactions_notified
+        )
+        try:
+            while not stop_event.is_set():
+                # Cleared before claiming, a notification arriving during the claim triggers another one
+                pending_transactions_notified.clear()
+                # A full batch means more transactions may be waiting, claim again before waiting for a notification
+                while (
+                    self._claim_pending_transactions(transactions_processor_factory)
+                    == PENDING_TRANSACTIONS_BATCH_SIZE
+                    and not stop_event.is_set()
+                ):
+                    # Let the consumers start on the claimed transactions between batches
+                    await asyncio.sleep(0)
+
+                # The timeout keeps the crawler going when the database cannot notify or a notification is missed
+                try:
+                    await asyncio.wait_for(
+                        pending_transactions_notified.wait(),
+                        timeout=self.consensus_sleep_time,
+                    )
+                except TimeoutError:
+                    pass
+        finally:
+            if stop_listening is not None:
+                stop_listening()
+
+    def _listen_for_pending_transactions(
+        self, notified: asyncio.Event
+    ) -> Callable[[], None] | None:
+        """
+        Listen on the pending_tx channel, notified by a trigger whenever a transaction becomes pending, on a dedicated
+        connection watched by the event loop.
+
+        Args:
+            notified (asyncio.Event): Set on every notification.
 
-                    if address is None:
-                        # it happens in tests/integration/accounts/test_accounts.py::test_accounts_burn
-                        print(f"_crawl_snapshot: address is None, tx {transaction}")
-                        traceback.print_stack()
+        Returns:
+            Callable[[], None] | None: Stops listening and releases the connection, None when the database cannot notify.
+        """
+        with self.get_session() as session:
+            engine = session.get_bind()
+        if engine.dialect.name != "postgresql" or engine.dialect.driver != "psycopg2":
+            return None
 
-                    # Initialize queue and stop event for the address if not present
-                    if address not in self.pending_queues:
-                        self.pending_queues[address] = asyncio.Queue()
+        try:
+            connection = engine.raw_connection()
+            dbapi_connection = connection.driver_connection
+            dbapi_connection.autocommit = True
+            with dbapi_connection.cursor() as cursor:
+                cursor.execute("LISTEN pending_tx")
+        except Exception as e:
+            print("Failed to listen for pending transactions, polling instead", e)
+            return None
 
-                    if address not in self.pending_queue_stop_events:
-                        self.pending_queue_stop_events[address] = asyncio.Event()
+        def on_readable():
+            dbapi_connection.poll()
+            if dbapi_connection.notifies:
+                dbapi_connection.notifies.clear()
+                notified.set()
 
-                    # Only add to the queue if the stop event is not set
-                    if not self.pending_queue_stop_events[address].is_set():
-                        await self.pending_queues[address].put(transaction)
+        loop = asyncio.get_running_loop()
+        fileno = dbapi_connection.fileno()
+        loop.add_reader(fileno, on_readable)
 
-                        # Set the transaction as activated so it is not added to the queue again
-                        ConsensusAlgorithm.dispatch_transaction_status_update(
-                            transactions_processor,
-                            transaction.hash,
-                            TransactionStatus.ACTIVATED,
-                            self.msg_handler,
-                        )
+        def stop_listening():
+            loop.remove_reader(fileno)
+            # The connection is still listening, drop it instead of returning it to the pool
+            connection.invalidate()
 
-            await asyncio.sleep(self.consensus_sleep_time)
+        return stop_listening
+
+    def _claim_pending_transactions(
+        self,
+        transactions_processor_factory: Callable[[Session], TransactionsProcessor],
+    ) -> int:
+        """
+        Claim a batch of pending transactions, put them in the queue of their contract and set them as activated.
+
+        Args:
+            transactions_processor_factory (Callable[[Session], TransactionsProcessor]): Creates processors to modify transactions.
+
+        Returns:
+            int: Number of transactions claimed.
+        """
+        # Queues being rolled back do not take transactions, leaving them out keeps the claimed rows from being claimed again
+        stopped_addresses = [
+            address
+            for address, stop_event in self.pending_queue_stop_events.items()
+            if stop_event.is_set() and address is not None
+        ]
+        with self.get_session() as session:
+            transactions_processor = transactions_processor_factory(session)
+            # Only the pending transactions are needed, a full chain snapshot would also load the accepted ones
+            pending_transactions = transactions_processor.claim_pending_transactions(
+                PENDING_TRANSACTIONS_BATCH_SIZE, stopped_addresses
+            )
+            activated_transaction_hashes = []
+            for transaction in pending_transactions:
+                transaction = Transaction.from_dict(transaction)
+                address = transaction.to_address
+
+                if address is None:
+                    # it happens in tests/integration/accounts/test_accounts.py::test_accounts_burn
+                    print(f"_crawl_snapshot: address is None, tx {transaction}")
+                    traceback.print_stack()
+
+                # Initialize queue and stop event for the address if not present
+                if address not in self.pending_queues:
+                    self.pending_queues[address] = asyncio.Queue()
+                    self.new_pending_queue_addresses.put_nowait(address)
+
+                if address not in self.pending_queue_stop_events:
+                    self.pending_queue_stop_events[address] = asyncio.Event()
+
+                # Only add to the queue if the stop event is not set
+                if not self.pending_queue_stop_events[address].is_set():
+                    self.pending_queues[address].put_nowait(transaction)
+                    activated_transaction_hashes.append(transaction.hash)
+
+            # Set the transactions as activated so they are not added to the queue again, with a single UPDATE for the batch
+            transactions_processor.update_transactions_status(
+                activated_transaction_hashes, TransactionStatus.ACTIVATED
+            )
+            self.msg_handler.enqueue_many(
+                _get_transaction_status_update_event(
+                    transaction_hash, TransactionStatus.ACTIVATED
+                )
+                for transaction_hash in activated_transaction_hashes
+            )
+        return len(pending_transactions)
 
     async def run_process_pending_transactions_loop(
         self,
@@ -440,8 +664,6 @@ class ConsensusAlgorithm:
                 stop_event,
             )
         except BaseException as e:
-            import traceback
-
             traceback.print_exception(e)
             raise
 
@@ -470,69 +692,163 @@ class ConsensusAlgorithm:
         """
         # Note: ollama uses GPU resources and webrequest aka selenium uses RAM
         # TODO: Consider using async sessions to avoid blocking the current thread
-        while not stop_event.is_set():
+        # Each pending queue gets its own consumer task, so a contract only waits for its own transactions
+        consumers: dict[str, asyncio.Task] = {}
+        try:
+            while not stop_event.is_set():
+                # Wake up as soon as a queue is created, the timeout bounds how late the stop event and finished consumers are noticed
+                try:
+                    await asyncio.wait_for(
+                        self.new_pending_queue_addresses.get(),
+                        timeout=self.consensus_sleep_time,
+                    )
+                except TimeoutError:
+                    pass
+
+                for queue_address in list(self.pending_queues):
+                    consumer = consumers.get(queue_address)
+                    if consumer is None or consumer.done():
+                        consumers[queue_address] = asyncio.create_task(
+                            self._process_pending_queue(
+                                queue_address,
+                                chain_snapshot_factory,
+                                transactions_processor_factory,
+                                accounts_manager_factory,
+                                contract_snapshot_factory,
+                                contract_processor_factory,
+                                node_factory,
+                            )
+                        )
+
+                # Consumers of retired queues are dropped, a queue created again for the address gets a new one
+                for queue_address, consumer in list(consumers.items()):
+                    if consumer.done() and queue_address not in self.pending_queues:
+                        del consumers[queue_address]
+        finally:
+            for consumer in consumers.values():
+                consumer.cancel()
+            await asyncio.gather(*consumers.values(), return_exceptions=True)
+
+    async def _process_pending_queue(
+        self,
+        queue_address: str,
+        chain_snapshot_factory: Callable[[Session], ChainSnapshot],
+        transactions_processor_factory: Callable[[Session], TransactionsProcessor],
+        accounts_manager_factory: Callable[[Session], AccountsManager],
+        contract_snapshot_factory: Callable[
+            [str, Session, Transaction], ContractSnapshot
+        ],
+        contract_processor_factory: Callable[[Session], ContractProcessor],
+        node_factory: NodeFactory,
+    ):
+        """
+        Execute the transactions of one pending queue in order, waking up only when a transaction is queued.
+        The queue is retired once it stays empty for PENDING_QUEUE_IDLE_TIMEOUT seconds, so contracts that are no longer used
+        do not keep a queue and a consumer forever.
+
+        Args:
+            queue_address (str): Address of the contract the queue belongs to.
+            chain_snapshot_factory (Callable[[Session], ChainSnapshot]): Creates snapshots of the blockchain state at specific points in time.
+            transactions_processor_factory (Callable[[Session], TransactionsProcessor]): Creates processors to modify transactions.
+            accounts_manager_factory (Callable[[Session], AccountsManager]): Creates managers to handle account state.
+            contract_snapshot_factory (Callable[[str, Session, Transaction], ContractSnapshot]): Creates snapshots of contract states.
+            node_factory (Callable[[dict, ExecutionMode, ContractSnapshot, Receipt | None, MessageHandler, Callable[[str], ContractSnapshot]], Node]): Creates node instances that can execute contracts and process transactions.
+        """
+        # The queue is emptied in place on rollback, so the same instance is used for the whole life of the consumer
+        queue = self.pending_queues[queue_address]
+        idle_event = self.pending_queue_task_idle_events.setdefault(
+            queue_address, asyncio.Event()
+        )
+        idle_event.set()
+        while True:
             try:
-                async with asyncio.TaskGroup() as tg:
-                    for queue_address, queue in self.pending_queues.items():
-                        if (
-                            not queue.empty()
-                            and not self.pending_queue_stop_events.get(
-                                queue_address, asyncio.Event()
-                            ).is_set()
+                transaction: Transaction = await asyncio.wait_for(
+                    queue.get(), timeout=PENDING_QUEUE_IDLE_TIMEOUT
+                )
+            except TimeoutError:
+                stop_event = self.pending_queue_stop_events.get(queue_address)
+                if queue.empty() and (stop_event is None or not stop_event.is_set()):
+                    # The crawler creates the queue again when a transaction for the contract shows up
+                    del self.pending_queues[queue_address]
+                    self.pending_queue_task_idle_events.pop(queue_address, None)
+                    self.pending_queue_stop_events.pop(queue_address, None)
+                    return
+                continue
+
+            # The queue is being rolled back, the transaction is set back to pending and crawled again
+            stop_event = self.pending_queue_stop_events.get(queue_address)
+            if stop_event is not None and stop_event.is_set():
+                continue
+
+            # Cleared before waiting for a slot, so a rollback waits for this transaction instead of racing it
+            idle_event.clear()
+            # A transaction cancelled on shutdown is left in its in-process status, restore_stuck_transactions recovers it on startup
+            try:
+                # Sessions cannot be shared between coroutines; create a new session for each transaction
+                # Reference: https://docs.sqlalchemy.org/en/20/orm/session_basics.html#is-the-session-thread-safe-is-asyncsession-safe-to-share-in-concurrent-tasks
+                async with self.pending_transactions_semaphore:
+                    with self.get_session() as session:
+                        transactions_processor = transactions_processor_factory(session)
+                        async with (
+                            self.validators_manager.snapshot() as validators_snapshot
                         ):
-                            # Sessions cannot be shared between coroutines; create a new session for each coroutine
-                            # Reference: https://docs.sqlalchemy.org/en/20/orm/session_basics.html#is-the-session-thread-safe-is-asyncsession-safe-to-share-in-concurrent-tasks
-                            self.pending_queue_task_running[queue_address] = True
-                            transaction: Transaction = await queue.get()
-                            with self.get_session() as session:
-
-                                async def exec_transaction_with_session_handling(
-                                    session: Session,
-                                    transaction: Transaction,
-                                    queue_address: str,
-                                ):
-                                    transactions_processor = (
-                                        transactions_processor_factory(session)
-                                    )
-                                    async with (
-                                        self.validators_manager.snapshot() as validators_snapshot
-                                    ):
-                                        await self.exec_transaction(
-                                            transaction,
-                                            transactions_processor,
-                                            chain_snapshot_factory(session),
-                                            accounts_manager_factory(session),
-                                            lambda contract_address: contract_snapshot_factory(
-                                                contract_address, session, transaction
-                                            ),
-                                            contract_processor_factory(session),
-                                            node_factory,
-                                            validators_snapshot,
-                                        )
-                                    session.commit()
-                                    self.pending_queue_task_running[queue_address] = (
-                                        False
-                                    )
-
-                            tg.create_task(
-                                exec_transaction_with_session_handling(
-                                    session, transaction, queue_address
-                                )
+                            await self.exec_transaction(
+                                transaction,
+                                transactions_processor,
+                                chain_snapshot_factory(session),
+                                accounts_manager_factory(session),
+                                partial(
+                                    contract_snapshot_factory,
+                                    session=session,
+                                    transaction=transaction,
+                                ),
+                                contract_processor_factory(session),
+                                node_factory,
+                                validators_snapshot,
                             )
-
+                        # Commits are blocking, run them in a thread so the other queues keep running
+                        await asyncio.to_thread(session.commit)
             except Exception as e:
                 print("Error running consensus", e)
                 print(traceback.format_exc())
+                self._cancel_failed_transaction(
+                    transaction, transactions_processor_factory
+                )
             finally:
-                for queue_address in self.pending_queues:
-                    self.pending_queue_task_running[queue_address] = False
-            await asyncio.sleep(self.consensus_sleep_time)
+                idle_event.set()
+
+    def _cancel_failed_transaction(
+        self,
+        transaction: Transaction,
+        transactions_processor_factory: Callable[[Session], TransactionsProcessor],
+    ):
+        """
+        Cancel a transaction whose execution raised while it was still in process, so it does not stay stuck in an
+        intermediate status. Its uncommitted changes were discarded with its session. Retrying it would fail again the same way.
+        """
+        try:
+            with self.get_session() as session:
+                transactions_processor = transactions_processor_factory(session)
+                status = transactions_processor.get_statuses_by_hashes(
+                    [transaction.hash]
+                ).get(transaction.hash)
+                # A transaction that already reached a final consensus status keeps it
+                if status in IN_PROCESS_STATUSES:
+                    ConsensusAlgorithm.dispatch_transaction_status_update(
+                        transactions_processor,
+                        transaction.hash,
+                        TransactionStatus.CANCELED,
+                        self.msg_handler,
+                    )
+        except Exception as e:
+            print(f"Failed to cancel transaction {transaction.hash}", e)
 
     def is_pending_queue_task_running(self, address: str):
         """
         Check if a task for a specific pending queue is currently running.
         """
-        return self.pending_queue_task_running.get(address, False)
+        idle_event = self.pending_queue_task_idle_events.get(address)
+        return idle_event is not None and not idle_event.is_set()
 
     def stop_pending_queue_task(self, address: str):
         """
@@ -586,7 +902,7 @@ class ConsensusAlgorithm:
             validators_snapshot=validators_snapshot,
         )
 
-        previous_transaction = transactions_processor.get_previous_transaction(
+        previous_transaction = transactions_processor.get_previous_transaction_status(
             transaction.hash,
         )
 
@@ -604,7 +920,7 @@ class ConsensusAlgorithm:
             )
         ):
             # Begin state transitions starting from PendingState
-            state = PendingState()
+            state = PENDING_STATE
             while True:
                 next_state = await state.handle(context)
                 if next_state is None:
@@ -635,19 +951,27 @@ class ConsensusAlgorithm:
             update_current_status_changes,
         )
 
-        # Send a message indicating the transaction status update
-        msg_handler.send_message(
-            LogEvent(
-                "transaction_status_updated",
-                EventType.INFO,
-                EventScope.CONSENSUS,
-                f"{str(new_status.value)} {str(transaction_hash)}",
-                {
-                    "hash": str(transaction_hash),
-                    "new_status": str(new_status.value),
-                },
-                transaction_hash=transaction_hash,
-            )
+        ConsensusAlgorithm.send_transaction_status_update_message(
+            transaction_hash, new_status, msg_handler
+        )
+
+    @staticmethod
+    def send_transaction_status_update_message(
+        transaction_hash: str,
+        new_status: TransactionStatus,
+        msg_handler: MessageHandler,
+    ):
+        """
+        Send a message indicating a transaction status update.
+
+        Args:
+            transaction_hash (str): Hash of the transaction.
+            new_status (TransactionStatus): New status of the transaction.
+            msg_handler (MessageHandler): Handler for messaging.
+        """
+        # Status updates are frequent, the message is emitted by the handler's background thread
+        msg_handler.enqueue(
+            _get_transaction_status_update_event(transaction_hash, new_status)
         )
 
     @staticmethod
@@ -670,39 +994,19 @@ class ConsensusAlgorithm:
             accounts_manager (AccountsManager): Manager to handle account balance updates.
         """
 
-        # Check if the transaction is a fund_account call
-        if not transaction.from_address is None:
-            # Get the balance of the sender account
-            from_balance = accounts_manager.get_account_balance(
-                transaction.from_address
-            )
-
-            # Check if the sender has enough balance
-            if from_balance < transaction.value:
-                # Set the transaction status to UNDETERMINED if balance is insufficient
-                ConsensusAlgorithm.dispatch_transaction_status_update(
-                    transactions_processor,
-                    transaction.hash,
-                    TransactionStatus.UNDETERMINED,
-                    msg_handler,
-                )
-
-                return
-
-            # Update the balance of the sender account
-            accounts_manager.update_account_balance(
-                transaction.from_address, from_balance - transaction.value
+        # A missing from_address is a fund_account call and a missing to_address is a burn call
+        if not accounts_manager.transfer(
+            transaction.from_address, transaction.to_address, transaction.value
+        ):
+            # Set the transaction status to UNDETERMINED if balance is insufficient
+            ConsensusAlgorithm.dispatch_transaction_status_update(
+                transactions_processor,
+                transaction.hash,
+                TransactionStatus.UNDETERMINED,
+                msg_handler,
             )
 
-        # Check if the transaction is a burn call
-        if not transaction.to_address is None:
-            # Get the balance of the recipient account
-            to_balance = accounts_manager.get_account_balance(transaction.to_address)
-
-            # Update the balance of the recipient account
-            accounts_manager.update_account_balance(
-                transaction.to_address, to_balance + transaction.value
-            )
+            return
 
         # Dispatch a transaction status update to FINALIZED
         ConsensusAlgorithm.dispatch_transaction_status_update(
@@ -754,8 +1058,6 @@ class ConsensusAlgorithm:
                 stop_event,
             )
         except BaseException as e:
-            import traceback
-
             traceback.print_exception(e)
             raise
 
@@ -799,109 +1101,19 @@ class ConsensusAlgorithm:
 
                             # Create a new session for each task so tasks can be run concurrently
                             with self.get_session() as task_session:
-
-                                async def exec_appeal_window_with_session_handling(
-                                    task_session: Session,
-                                    accepted_undetermined_queue: list[dict],
-                                    captured_chain_snapshot: ChainSnapshot = chain_snapshot,
-                                ):
-                                    transactions_processor = (
-                                        transactions_processor_factory(task_session)
-                                    )
-
-                                    # Go through the whole queue to check for appeals and finalizations
-                                    for index, transaction in enumerate(
-                                        accepted_undetermined_queue
-                                    ):
-                                        current_transaction = Transaction.from_dict(
-                                            transaction
-                                        )
-
-                                        # Check if the transaction is appealed
-                                        if not current_transaction.appealed:
-
-                                            # Check if the transaction can be finalized
-                                            if self.can_finalize_transaction(
-                                                transactions_processor,
-                                                current_transaction,
-                                                index,
-                                                accepted_undetermined_queue,
-                                            ):
-
-                                                # Handle transactions that need to be finalized
-                                                await self.process_finalization(
-                                                    current_transaction,
-                                                    transactions_processor,
-                                                    captured_chain_snapshot,
-                                                    accounts_manager_factory(
-                                                        task_session
-                                                    ),
-                                                    lambda contract_address: contract_snapshot_factory(
-                                                        contract_address,
-                                                        task_session,
-                                                        current_transaction,
-                                                    ),
-                                                    contract_processor_factory(
-                                                        task_session
-                                                    ),
-                                                    node_factory,
-                                                )
-                                                task_session.commit()
-
-                                        else:
-                                            async with (
-                                                self.validators_manager.snapshot() as validators_snapshot
-                                            ):
-                                                # Handle transactions that are appealed
-                                                if (
-                                                    current_transaction.status
-                                                    == TransactionStatus.UNDETERMINED
-                                                ):
-                                                    # Leader appeal
-                                                    await self.process_leader_appeal(
-                                                        current_transaction,
-                                                        transactions_processor,
-                                                        captured_chain_snapshot,
-                                                        accounts_manager_factory(
-                                                            task_session
-                                                        ),
-                                                        lambda contract_address: contract_snapshot_factory(
-                                                            contract_address,
-                                                            task_session,
-                                                            current_transaction,
-                                                        ),
-                                                        contract_processor_factory(
-                                                            task_session
-                                                        ),
-                                                        node_factory,
-                                                        validators_snapshot,
-                                                    )
-                                                    task_session.commit()
-                                                else:
-                                                    # Validator appeal
-                                                    await self.process_validator_appeal(
-                                                        current_transaction,
-                                                        transactions_processor,
-                                                        captured_chain_snapshot,
-                                                        accounts_manager_factory(
-                                                            task_session
-                                                        ),
-                                                        lambda contract_address: contract_snapshot_factory(
-                                                            contract_address,
-                                                            task_session,
-                                                            current_transaction,
-                                                        ),
-                                                        contract_processor_factory(
-                                                            task_session
-                                                        ),
-                                                        node_factory,
-                                                        validators_snapshot,
-                                                    )
-                                                    task_session.commit()
-
                                 tg.create_task(
-                                    exec_appeal_window_with_session_handling(
-                                        task_session, accepted_undetermined_queue
+                                    _run_with_semaphore(
+                                        self.appeal_window_semaphore,
+                                        self._process_appeal_window_queue(
+                                            accepted_undetermined_queue,
+                                            task_session,
+                                            chain_snapshot,
+                                            transactions_processor_factory,
+                                            accounts_manager_factory,
+                                            contract_snapshot_factory,
+                                            contract_processor_factory,
+                                            node_factory,
+                                        ),
                                     )
                                 )
 
@@ -910,12 +1122,127 @@ class ConsensusAlgorithm:
                 print(traceback.format_exc())
             await asyncio.sleep(self.consensus_sleep_time)
 
+    async def _process_appeal_window_queue(
+        self,
+        accepted_undetermined_queue: list[dict],
+        task_session: Session,
+        chain_snapshot: ChainSnapshot,
+        transactions_processor_factory: Callable[[Session], TransactionsProcessor],
+        accounts_manager_factory: Callable[[Session], AccountsManager],
+        contract_snapshot_factory: Callable[
+            [str, Session, Transaction], ContractSnapshot
+        ],
+        contract_processor_factory: Callable[[Session], ContractProcessor],
+        node_factory: NodeFactory,
+    ):
+        """
+        Check the accepted and undetermined transactions of one contract for appeals and finalizations.
+
+        Args:
+            accepted_undetermined_queue (list[dict]): Accepted and undetermined transactions of the contract, in order.
+            task_session (Session): Session used by this queue only, so queues can be run concurrently.
+            chain_snapshot (ChainSnapshot): Snapshot of the chain state shared by all queues of the appeal window round.
+            transactions_processor_factory (Callable[[Session], TransactionsProcessor]): Creates processors to modify transactions.
+            accounts_manager_factory (Callable[[Session], AccountsManager]): Creates managers to handle account state.
+            contract_snapshot_factory (Callable[[str, Session, Transaction], ContractSnapshot]): Creates snapshots of contract states.
+            contract_processor_factory (Callable[[Session], ContractProcessor]): Creates processors to modify contracts.
+            node_factory (Callable[[dict, ExecutionMode, ContractSnapshot, Receipt | None, MessageHandler, Callable[[str], ContractSnapshot]], Node]): Creates node instances that can execute contracts and process transactions.
+        """
+        transactions_processor = transactions_processor_factory(task_session)
+
+        # Fetch the statuses of the whole queue at once instead of one query per transaction
+        transaction_statuses = transactions_processor.get_statuses_by_hashes(
+            [transaction["hash"] for transaction in accepted_undetermined_queue]
+        )
+
+        now = time.time()
+
+        # Finalization follows the queue order, once a transaction is not finalized no later one can be
+        finalization_blocked = False
+
+        # Go through the whole queue to check for appeals and finalizations
+        for index, transaction in enumerate(accepted_undetermined_queue):
+            current_transaction = Transaction.from_dict(transaction)
+
+            # Check if the transaction is appealed
+            if not current_transaction.appealed:
+
+                # Check if the transaction can be finalized
+                if (not finalization_blocked) and self.can_finalize_transaction(
+                    current_transaction,
+                    (
+                        transaction_statuses.get(
+                            accepted_undetermined_queue[index - 1]["hash"]
+                        )
+                        if index > 0
+                        else None
+                    ),
+                    now,
+                ):
+
+                    # Handle transactions that need to be finalized
+                    await self.process_finalization(
+                        current_transaction,
+                        transactions_processor,
+                        chain_snapshot,
+                        accounts_manager_factory(task_session),
+                        partial(
+                            contract_snapshot_factory,
+                            session=task_session,
+                            transaction=current_transaction,
+                        ),
+                        contract_processor_factory(task_session),
+                        node_factory,
+                    )
+                    await asyncio.to_thread(task_session.commit)
+                    transaction_statuses[current_transaction.hash] = FINALIZED_STATUS
+                else:
+                    finalization_blocked = True
+
+            else:
+                finalization_blocked = True
+                async with self.validators_manager.snapshot() as validators_snapshot:
+                    # Handle transactions that are appealed
+                    if current_transaction.status == TransactionStatus.UNDETERMINED:
+                        # Leader appeal
+                        await self.process_leader_appeal(
+                            current_transaction,
+                            transactions_processor,
+                            chain_snapshot,
+                            accounts_manager_factory(task_session),
+                            partial(
+                                contract_snapshot_factory,
+                                session=task_session,
+                                transaction=current_transaction,
+                            ),
+                            contract_processor_factory(task_session),
+                            node_factory,
+                            validators_snapshot,
+                        )
+                        await asyncio.to_thread(task_session.commit)
+                    else:
+                        # Validator appeal
+                        await self.process_validator_appeal(
+                            current_transaction,
+                            transactions_processor,
+                            chain_snapshot,
+                            accounts_manager_factory(task_session),
+                            partial(
+                                contract_snapshot_factory,
+                                session=task_session,
+                                transaction=current_transaction,
+                            ),
+                            contract_processor_factory(task_session),
+                            node_factory,
+                            validators_snapshot,
+                        )
+                        await asyncio.to_thread(task_session.commit)
+
     def can_finalize_transaction(
         self,
-        transactions_processor: TransactionsProcessor,
         transaction: Transaction,
-        index: int,
-        accepted_undetermined_queue: list[dict],
+        previous_transaction_status: str | None,
+        now: float,
     ) -> bool:
         """
         Check if the transaction can be finalized based on the following criteria:
@@ -924,41 +1251,32 @@ class ConsensusAlgorithm:
         - The previous transaction has been finalized
 
         Args:
-            transactions_processor (TransactionsProcessor): The transactions processor instance.
             transaction (Transaction): The transaction to be possibly finalized.
-            index (int): The index of the current transaction in the accepted_undetermined_queue.
-            accepted_undetermined_queue (list[dict]): The list of accepted and undetermined transactions for one contract.
+            previous_transaction_status (str | None): The status of the previous transaction in the queue, None if the transaction is the first one.
+            now (float): Current time in seconds, read once per queue scan.
 
         Returns:
             bool: True if the transaction can be finalized, False otherwise.
         """
-        if (transaction.leader_only) or (
+        # The cheap ordering check goes first so the finality window is not computed needlessly
+        if (
+            previous_transaction_status is not None
+            and previous_transaction_status != FINALIZED_STATUS
+        ):
+            return False
+
+        return (transaction.leader_only) or (
             (
-                time.time()
+                now
                 - transaction.timestamp_awaiting_finalization
                 - transaction.appeal_processing_time
             )
             > self.finality_window_time
-            * (
-                (1 - self.finality_window_appeal_failed_reduction)
-                ** transaction.appeal_failed
+            * _get_finality_window_reduction_factor(
+                transaction.appeal_failed,
+                self.finality_window_appeal_failed_reduction,
             )
-        ):
-            if index == 0:
-                return True
-            else:
-                previous_transaction_hash = accepted_undetermined_queue[index - 1][
-                    "hash"
-                ]
-                previous_transaction = transactions_processor.get_transaction_by_hash(
-                    previous_transaction_hash
-                )
-                if previous_transaction["status"] == TransactionStatus.FINALIZED.value:
-                    return True
-                else:
-                    return False
-        else:
-            return False
+        )
 
     async def process_finalization(
         self,
@@ -996,7 +1314,7 @@ class ConsensusAlgorithm:
         )
 
         # Transition to the FinalizingState
-        state = FinalizingState()
+        state = FINALIZING_STATE
         await state.handle(context)
 
     async def process_leader_appeal(
@@ -1021,6 +1339,8 @@ class ConsensusAlgorithm:
             contract_snapshot_factory (Callable[[str], ContractSnapshot]): Factory function to create contract snapshots.
             node_factory (Callable[[dict, ExecutionMode, ContractSnapshot, Receipt | None, MessageHandler, Callable[[str], ContractSnapshot]], Node]): Factory function to create nodes.
         """
+        transaction_hash = transaction.hash
+
         # Create a transaction context for the appeal
         context = TransactionContext(
             transaction=transaction,
@@ -1035,61 +1355,42 @@ class ConsensusAlgorithm:
             consensus_service=self.consensus_service,
         )
 
-        transactions_processor.set_transaction_appeal(transaction.hash, False)
-        transaction.appealed = False
-
+        # The transaction was loaded from the chain snapshot, so its consensus history is already up to date
         used_leader_addresses = (
             ConsensusAlgorithm.get_used_leader_addresses_from_consensus_history(
-                context.transactions_processor.get_transaction_by_hash(
-                    context.transaction.hash
-                )["consensus_history"]
+                transaction.consensus_history
             )
         )
 
         if len(transaction.consensus_data.validators) + len(
             used_leader_addresses
         ) >= len(validators_snapshot.nodes):
-            self.msg_handler.send_message(
-                LogEvent(
-                    "consensus_event",
-                    EventType.ERROR,
-                    EventScope.CONSENSUS,
-                    "Appeal failed, no validators found to process the appeal",
-                    {
-                        "transaction_hash": transaction.hash,
-                    },
-                    transaction_hash=transaction.hash,
-                )
-            )
-            self.msg_handler.send_message(
-                log_event=LogEvent(
-                    "transaction_appeal_updated",
-                    EventType.INFO,
-                    EventScope.CONSENSUS,
-                    "Set transaction appealed",
-                    {
-                        "hash": context.transaction.hash,
-                    },
-                ),
-                log_to_terminal=False,
+            # Blocking database writes run in a thread so the tasks of the other contracts are not stalled
+            await asyncio.to_thread(
+                transactions_processor.reset_transaction_appeal, transaction_hash
             )
+            transaction.appealed = False
+            _emit_appeal_failed(self.msg_handler, transaction_hash)
 
         else:
             # Appeal data member is used in the frontend for both types of appeals
             # Here the type is refined based on the status
-            transactions_processor.set_transaction_appeal_undetermined(
-                transaction.hash, True
+            await asyncio.to_thread(
+                transactions_processor.reset_transaction_appeal,
+                transaction_hash,
+                appeal_undetermined=True,
             )
+            transaction.appealed = False
             transaction.appeal_undetermined = True
 
             # Begin state transitions starting from PendingState
-            state = PendingState()
+            state = PENDING_STATE
             while True:
                 next_state = await state.handle(context)
                 if next_state is None:
                     break
-                elif next_state == "leader_appeal_success":
-                    self.rollback_transactions(context)
+                elif next_state is AppealSuccess.LEADER:
+                    await self.rollback_transactions(context)
                     break
                 state = next_state
 
@@ -1115,6 +1416,8 @@ class ConsensusAlgorithm:
             contract_snapshot_factory (Callable[[str], ContractSnapshot]): Factory function to create contract snapshots.
             node_factory (Callable[[dict, ExecutionMode, ContractSnapshot, Receipt | None, MessageHandler, Callable[[str], ContractSnapshot]], Node]): Factory function to create nodes.
         """
+        transaction_hash = transaction.hash
+
         # Create a transaction context for the appeal
         context = TransactionContext(
             transaction=transaction,
@@ -1136,136 +1439,109 @@ class ConsensusAlgorithm:
         try:
             # Attempt to get extra validators for the appeal process
             _, context.remaining_validators = ConsensusAlgorithm.get_extra_validators(
-                [x.validator.to_dict() for x in validators_snapshot.nodes],
+                context.validators_by_address,
                 transaction.consensus_history,
                 transaction.consensus_data,
                 transaction.appeal_failed,
             )
         except ValueError as e:
             # When no validators are found, then the appeal failed
-            context.msg_handler.send_message(
-                LogEvent(
-                    "consensus_event",
-                    EventType.ERROR,
-                    EventScope.CONSENSUS,
-                    "Appeal failed, no validators found to process the appeal",
-                    {
-                        "transaction_hash": context.transaction.hash,
-                    },
-                    transaction_hash=context.transaction.hash,
-                )
-            )
-            context.transactions_processor.set_transaction_appeal(
-                context.transaction.hash, False
-            )
-            context.transaction.appealed = False
-            self.msg_handler.send_message(
-                log_event=LogEvent(
-                    "transaction_appeal_updated",
-                    EventType.INFO,
-                    EventScope.CONSENSUS,
-                    "Set transaction appealed",
-                    {
-                        "hash": context.transaction.hash,
-                    },
-                ),
-                log_to_terminal=False,
-            )
-            context.transactions_processor.set_transaction_appeal_processing_time(
-                context.transaction.hash
+            await asyncio.to_thread(
+                transactions_processor.reset_transaction_appeal,
+                transaction_hash,
+                update_appeal_processing_time=True,
             )
+            transaction.appealed = False
+            _emit_appeal_failed(self.msg_handler, transaction_hash)
         else:
             # Set up the context for the committing state
             context.num_validators = len(context.remaining_validators)
-            context.votes = {}
+            remaining_validator_addresses = [
+                validator["address"] for validator in context.remaining_validators
+            ]
+            # Every remaining validator votes in RevealingState, size the dict for all of them upfront
+            context.votes = dict.fromkeys(remaining_validator_addresses)
 
             # Send events in rollup to communicate the appeal is started
             context.consensus_service.emit_transaction_event(
                 "emitAppealStarted",
                 context.remaining_validators[0],
-                context.transaction.hash,
-                context.remaining_validators[0]["address"],
+                transaction_hash,
+                remaining_validator_addresses[0],
                 0,
-                [v["address"] for v in context.remaining_validators],
+                remaining_validator_addresses,
             )
 
             # Begin state transitions starting from CommittingState
-            state = CommittingState()
+            state = COMMITTING_STATE
             while True:
                 next_state = await state.handle(context)
                 if next_state is None:
                     break
-                elif next_state == "validator_appeal_success":
-                    self.rollback_transactions(context)
-                    ConsensusAlgorithm.dispatch_transaction_status_update(
-                        context.transactions_processor,
-                        context.transaction.hash,
-                        TransactionStatus.PENDING,
-                        context.msg_handler,
-                    )
+                elif next_state is AppealSuccess.VALIDATOR:
+                    # The appealed transaction is set back to PENDING and its contract snapshot cleared
+                    # by the same UPDATE as the newer transactions, the contract state update commits them together
+                    await self.rollback_transactions(context, include_transaction=True)
 
                     # Get the previous state of the contract
-                    if context.transaction.contract_snapshot:
-                        previous_contact_state = (
-                            context.transaction.contract_snapshot.states["accepted"]
-                        )
+                    if transaction.contract_snapshot:
+                        previous_contact_state = transaction.contract_snapshot.states[
+                            "accepted"
+                        ]
                     else:
                         previous_contact_state = {}
 
                     # Restore the contract state
                     context.contract_processor.update_contract_state(
-                        context.transaction.to_address,
+                        transaction.to_address,
                         accepted_state=previous_contact_state,
                     )
 
-                    # Reset the contract snapshot for the transaction
-                    context.transactions_processor.set_transaction_contract_snapshot(
-                        context.transaction.hash, None
-                    )
-
                     # Transaction will be picked up by _crawl_snapshot
                     break
                 state = next_state
 
-    def rollback_transactions(self, context: TransactionContext):
+    async def rollback_transactions(
+        self, context: TransactionContext, include_transaction: bool = False
+    ):
         """
-        Rollback newer transactions.
+        Rollback newer transactions, and the transaction of the context itself when include_transaction is True.
+        The reset is not committed here, the caller commits it with the rest of the appeal.
         """
         # Rollback all future transactions for the current contract
         # Stop the _crawl_snapshot and the _run_consensus for the current contract
         address = context.transaction.to_address
         self.stop_pending_queue_task(address)
 
-        # Wait until task is finished
-        while self.is_pending_queue_task_running(address):
-            time.sleep(1)
+        # Wait until the task has finished its current transaction
+        idle_event = self.pending_queue_task_idle_events.get(address)
+        if idle_event is not None:
+            await idle_event.wait()
 
-        # Empty the pending queue
-        self.pending_queues[address] = asyncio.Queue()
+        # Empty the pending queue in place, its consumer keeps waiting on the same instance
+        queue = self.pending_queues.get(address)
+        while queue is not None and not queue.empty():
+            queue.get_nowait()
 
-        # Set all transactions with higher created_at to PENDING
-        future_transactions = context.transactions_processor.get_newer_transactions(
-            context.transaction.hash
-        )
-        for future_transaction in future_transactions:
-            ConsensusAlgorithm.dispatch_transaction_status_update(
-                context.transactions_processor,
-                future_transaction["hash"],
-                TransactionStatus.PENDING,
-                context.msg_handler,
+        # Set all transactions with higher created_at to PENDING and reset their contract snapshot in a single write
+        future_transaction_hashes = (
+            context.transactions_processor.reset_newer_transactions_to_pending(
+                context.transaction.hash, include_transaction
             )
-
-            # Reset the contract snapshot for the transaction
-            context.transactions_processor.set_transaction_contract_snapshot(
-                future_transaction["hash"], None
+        )
+        context.msg_handler.enqueue_many(
+            _get_transaction_status_update_event(
+                future_transaction_hash, TransactionStatus.PENDING
             )
+            for future_transaction_hash in future_transaction_hashes
+        )
 
         # Start the queue loop again
         self.start_pending_queue_task(address)
 
     @staticmethod
     def get_extra_validators(
-        all_validators: List[dict],
+        validators_by_address: dict[str, dict],
         consensus_history: dict,
         consensus_data: ConsensusData,
         appeal_failed: int,
@@ -1298,7 +1574,7 @@ class ConsensusAlgorithm:
         This is used to calculate n
 
         Args:
-            all_validators (List[dict]): List of all validators.
+            validators_by_address (dict[str, dict]): All validators indexed by address.
             consensus_history (dict): Dictionary of consensus rounds results and status changes.
             consensus_data (ConsensusData): Data related to the consensus process.
             appeal_failed (int): Number of times the appeal has failed.
@@ -1307,100 +1583,82 @@ class ConsensusAlgorithm:
             list: List of current validators.
             list: List of extra validators.
         """
-        # Get current validators and a dictionary mapping addresses to validators not used in the consensus process
-        current_validators, validator_map = (
-            ConsensusAlgorithm.get_validators_from_consensus_data(
-                all_validators, consensus_data, False
-            )
+        # Get current validators
+        current_validators = ConsensusAlgorithm.get_validators_from_consensus_data(
+            validators_by_address, consensus_data, False
         )
 
-        # Remove used leaders from validator_map
-        used_leader_addresses = (
+        # Set not_used_validators to the validators that are neither current validators nor were used as leaders
+        used_addresses = (
             ConsensusAlgorithm.get_used_leader_addresses_from_consensus_history(
                 consensus_history
             )
         )
-        for used_leader_address in used_leader_addresses:
-            if used_leader_address in validator_map:
-                validator_map.pop(used_leader_address)
-
-        # Set not_used_validators to the remaining validators in validator_map
-        not_used_validators = list(validator_map.values())
+        used_addresses.update(validator["address"] for validator in current_validators)
+        not_used_validators = [
+            validator
+            for address, validator in validators_by_address.items()
+            if address not in used_addresses
+        ]
 
         if len(not_used_validators) == 0:
             raise ValueError("No validators found")
 
         nb_current_validators = len(current_validators) + 1  # including the leader
-        if appeal_failed == 0:
-            # Calculate extra validators when no appeal has failed
-            extra_validators = get_validators_for_transaction(
-                not_used_validators, nb_current_validators + 2
-            )
-        elif appeal_failed == 1:
-            # Calculate extra validators when one appeal has failed
-            n = (nb_current_validators - 2) // 2
+        reused_validators_start, nb_extra_validators = _get_appeal_validators_split(
+            nb_current_validators, appeal_failed
+        )
+        if reused_validators_start is None:
+            # No appeal has failed, only select extra validators
             extra_validators = get_validators_for_transaction(
-                not_used_validators, n + 1
+                not_used_validators, nb_extra_validators
             )
-            extra_validators = current_validators[n - 1 :] + extra_validators
         else:
-            # Calculate extra validators when more than one appeal has failed
-            n = (nb_current_validators - 3) // (2 * appeal_failed - 1)
-            extra_validators = get_validators_for_transaction(
-                not_used_validators, 2 * n
+            # Reuse the validators of the previous appeal round and select extra validators
+            extra_validators = current_validators[reused_validators_start:]
+            extra_validators.extend(
+                get_validators_for_transaction(not_used_validators, nb_extra_validators)
             )
-            extra_validators = current_validators[n - 1 :] + extra_validators
 
         return current_validators, extra_validators
 
     @staticmethod
     def get_validators_from_consensus_data(
-        all_validators: List[dict], consensus_data: ConsensusData, include_leader: bool
-    ):
+        validators_by_address: dict[str, dict],
+        consensus_data: ConsensusData,
+        include_leader: bool,
+    ) -> List[dict]:
         """
         Get validators from consensus data.
 
         Args:
-            all_validators (List[dict]): List of all validators.
+            validators_by_address (dict[str, dict]): All validators indexed by address.
             consensus_data (ConsensusData): Data related to the consensus process.
             include_leader (bool): Whether to get the leader in the validator set.
         Returns:
             list: List of validators involved in the consensus process (can include the leader).
-            dict: Dictionary mapping addresses to validators not used in the consensus process.
         """
-        # Create a dictionary to map addresses to a validator
-        validator_map = {
-            validator["address"]: validator for validator in all_validators
-        }
-
-        # Extract address of the leader from consensus data
+        receipts = consensus_data.validators
         if include_leader:
-            receipt_addresses = [
-                consensus_data.leader_receipt[0].node_config["address"]
-            ]
-        else:
-            receipt_addresses = []
+            # The leader comes first
+            receipts = chain(consensus_data.leader_receipt[:1], receipts)
 
-        # Extract addresses of validators from consensus data
-        receipt_addresses += [
-            receipt.node_config["address"] for receipt in consensus_data.validators
-        ]
-
-        # Return validators whose addresses are in the receipt addresses
-        validators = [
-            validator_map.pop(receipt_address)
-            for receipt_address in receipt_addresses
-            if receipt_address in validator_map
-        ]
+        # Single pass over the receipts, keyed by address so each validator is only returned once
+        validators: dict[str, dict] = {}
+        for receipt in receipts:
+            receipt_address = receipt.node_config["address"]
+            validator = validators_by_address.get(receipt_address)
+            if validator is not None:
+                validators.setdefault(receipt_address, validator)
 
-        return validators, validator_map
+        return list(validators.values())
 
     @staticmethod
-    def add_new_validator(
+    def get_not_used_validators(
         all_validators: List[dict], validators: List[dict], leader_addresses: set[str]
-    ):
+    ) -> List[dict]:
         """
-        Add a new validator to the list of validators.
+        Get the validators that are neither current validators nor previous leaders.
 
         Args:
             all_validators (List[dict]): List of all validators.
@@ -1408,32 +1666,48 @@ class ConsensusAlgorithm:
             leader_addresses (set[str]): Set of leader addresses.
 
         Returns:
-            list: List of validators.
+            List[dict]: List of not used validators.
         """
-        # Check if there is a validator to be possibly selected
-        if len(leader_addresses) + len(validators) >= len(all_validators):
-            raise ValueError("No more validators found to add a new validator")
-
         # Extract a set of addresses of validators and leaders
         addresses = {validator["address"] for validator in validators}
         addresses.update(leader_addresses)
 
-        # Get not used validators
-        not_used_validators = [
+        return [
             validator
             for validator in all_validators
             if validator["address"] not in addresses
         ]
 
-        # Get new validator
-        new_validator = get_validators_for_transaction(not_used_validators, 1)
+    @staticmethod
+    def add_new_validator(not_used_validators: List[dict], validators: List[dict]):
+        """
+        Add a new validator to the list of validators. The new validator is removed from not_used_validators,
+        so the same list can be passed again on the next rotation.
+
+        Args:
+            not_used_validators (List[dict]): List of validators that can still be selected.
+            validators (list[dict]): List of validators.
+
+        Returns:
+            list: List of validators.
+        """
+        # Check if there is a validator to be possibly selected
+        if not not_used_validators:
+            raise ValueError("No more validators found to add a new validator")
+
+        # Get new validator, there is nothing to sample when a single validator is left
+        if len(not_used_validators) == 1:
+            new_validator = [not_used_validators.pop()]
+        else:
+            new_validator = get_validators_for_transaction(not_used_validators, 1)
+            not_used_validators.remove(new_validator[0])
 
         return new_validator + validators
 
     @staticmethod
     def get_used_leader_addresses_from_consensus_history(
         consensus_history: dict, current_leader_receipt: Receipt | None = None
-    ):
+    ) -> set[str]:
         """
         Get the used leader addresses from the consensus history.
 
@@ -1444,20 +1718,15 @@ class ConsensusAlgorithm:
         Returns:
             set[str]: Set of used leader addresses.
         """
-        used_leader_addresses = set()
-        if "consensus_results" in consensus_history:
-            for consensus_round in consensus_history["consensus_results"]:
-                leader_receipt = consensus_round["leader_result"]
-                if leader_receipt:
-                    used_leader_addresses.update(
-                        [leader_receipt[0]["node_config"]["address"]]
-                    )
+        used_leader_addresses = {
+            consensus_round["leader_result"][0]["node_config"]["address"]
+            for consensus_round in consensus_history.get("consensus_results", ())
+            if consensus_round["leader_result"]
+        }
 
         # consensus_history does not contain the latest consensus_data
         if current_leader_receipt:
-            used_leader_addresses.update(
-                [current_leader_receipt.node_config["address"]]
-            )
+            used_leader_addresses.add(current_leader_receipt.node_config["address"])
 
         return used_leader_addresses
 
@@ -1471,7 +1740,7 @@ class ConsensusAlgorithm:
         self.finality_window_time = time
 
         # Send log event to update the frontend value
-        self.msg_handler.send_message(
+        self.msg_handler.enqueue(
             LogEvent(
                 name="finality_window_time_updated",
                 type=EventType.INFO,
@@ -1483,6 +1752,15 @@ class ConsensusAlgorithm:
         )
 
 
+class AppealSuccess(Enum):
+    """
+    Returned by a state instead of the next state when an appeal succeeded, the caller then rolls back the transactions.
+    """
+
+    LEADER = "leader_appeal_success"
+    VALIDATOR = "validator_appeal_success"
+
+
 class TransactionState(ABC):
     """
     Abstract base class representing a state in the transaction process.
@@ -1491,7 +1769,7 @@ class TransactionState(ABC):
     @abstractmethod
     async def handle(
         self, context: TransactionContext
-    ) -> 'TransactionState | None | Literal["leader_appeal_success", "validator_appeal_success"]':
+    ) -> "TransactionState | AppealSuccess | None":
         """
         Handle the state transition.
 
@@ -1523,7 +1801,7 @@ class PendingState(TransactionState):
             )
         )
 
-        context.msg_handler.send_message(
+        context.msg_handler.enqueue(
             LogEvent(
                 "consensus_event",
                 EventType.INFO,
@@ -1549,16 +1827,11 @@ class PendingState(TransactionState):
             return None
 
         # Retrieve all validators from the snapshot
-        if context.validators_snapshot is None:
-            all_validators = None
-        else:
-            all_validators = [
-                n.validator.to_dict() for n in context.validators_snapshot.nodes
-            ]
+        all_validators = context.all_validators
 
         # Check if there are validators available
         if not all_validators:
-            context.msg_handler.send_message(
+            context.msg_handler.enqueue(
                 LogEvent(
                     "consensus_event",
                     EventType.ERROR,
@@ -1575,9 +1848,11 @@ class PendingState(TransactionState):
         # Determine the involved validators based on whether the transaction is appealed
         if context.transaction.appealed:
             # If the transaction is appealed, remove the old leader
-            context.involved_validators, _ = (
+            context.involved_validators = (
                 ConsensusAlgorithm.get_validators_from_consensus_data(
-                    all_validators, context.transaction.consensus_data, False
+                    context.validators_by_address,
+                    context.transaction.consensus_data,
+                    False,
                 )
             )
 
@@ -1591,7 +1866,7 @@ class PendingState(TransactionState):
             # Add n+2 validators, remove the old leader
             current_validators, extra_validators = (
                 ConsensusAlgorithm.get_extra_validators(
-                    all_validators,
+                    context.validators_by_address,
                     context.transaction.consensus_history,
                     context.transaction.consensus_data,
                     0,
@@ -1613,9 +1888,11 @@ class PendingState(TransactionState):
             # If there was no validator appeal or leader appeal
             if context.transaction.consensus_data:
                 # Transaction was rolled back, so we need to reuse the validators and leader
-                context.involved_validators, _ = (
+                context.involved_validators = (
                     ConsensusAlgorithm.get_validators_from_consensus_data(
-                        all_validators, context.transaction.consensus_data, True
+                        context.validators_by_address,
+                        context.transaction.consensus_data,
+                        True,
                     )
                 )
 
@@ -1626,8 +1903,10 @@ class PendingState(TransactionState):
                 )
 
         # Transition to the ProposingState
-        return ProposingState(
-            activate=False if context.transaction.appeal_undetermined else True
+        return (
+            PROPOSING_STATE
+            if context.transaction.appeal_undetermined
+            else ACTIVATING_PROPOSING_STATE
         )
 
 
@@ -1713,7 +1992,7 @@ class ProposingState(TransactionState):
         context.num_validators = len(context.remaining_validators) + 1
 
         # Transition to the CommittingState
-        return CommittingState()
+        return COMMITTING_STATE
 
 
 class CommittingState(TransactionState):
@@ -1810,7 +2089,7 @@ class CommittingState(TransactionState):
             )
 
         # Transition to the RevealingState
-        return RevealingState()
+        return REVEALING_STATE
 
 
 class RevealingState(TransactionState):
@@ -1828,10 +2107,14 @@ class RevealingState(TransactionState):
         Returns:
             TransactionState | None: The AcceptedState or ProposingState or None if the transaction is successfully appealed.
         """
+        transaction = context.transaction
+        transaction_hash = transaction.hash
+        transactions_processor = context.transactions_processor
+
         # Update the transaction status to REVEALING
         ConsensusAlgorithm.dispatch_transaction_status_update(
-            context.transactions_processor,
-            context.transaction.hash,
+            transactions_processor,
+            transaction_hash,
             TransactionStatus.REVEALING,
             context.msg_handler,
         )
@@ -1854,7 +2137,7 @@ class RevealingState(TransactionState):
             context.consensus_service.emit_transaction_event(
                 "emitVoteRevealed",
                 context.consensus_data.leader_receipt[0].node_config,
-                context.transaction.hash,
+                transaction_hash,
                 context.consensus_data.leader_receipt[0].node_config["address"],
                 1,
                 False,
@@ -1881,72 +2164,71 @@ class RevealingState(TransactionState):
             context.consensus_service.emit_transaction_event(
                 "emitVoteRevealed",
                 validation_result.node_config,
-                context.transaction.hash,
+                transaction_hash,
                 validation_result.node_config["address"],
                 type_vote,
                 last_vote,
                 result_vote,
             )
 
-        if context.transaction.appealed:
+        if transaction.appealed:
 
             # Update the consensus results with all new votes and validators
             context.consensus_data.votes = (
-                context.transaction.consensus_data.votes | context.votes
+                transaction.consensus_data.votes | context.votes
             )
 
             # Overwrite old validator results based on the number of appeal failures
-            if context.transaction.appeal_failed == 0:
+            if transaction.appeal_failed == 0:
                 context.consensus_data.validators = (
-                    context.transaction.consensus_data.validators
-                    + context.validation_results
+                    transaction.consensus_data.validators + context.validation_results
                 )
 
-            elif context.transaction.appeal_failed == 1:
-                n = (len(context.transaction.consensus_data.validators) - 1) // 2
+            elif transaction.appeal_failed == 1:
+                n = (len(transaction.consensus_data.validators) - 1) // 2
                 context.consensus_data.validators = (
-                    context.transaction.consensus_data.validators[: n - 1]
+                    transaction.consensus_data.validators[: n - 1]
                     + context.validation_results
                 )
 
             else:
                 n = len(context.validation_results) - (
-                    len(context.transaction.consensus_data.validators) + 1
+                    len(transaction.consensus_data.validators) + 1
                 )
                 context.consensus_data.validators = (
-                    context.transaction.consensus_data.validators[: n - 1]
+                    transaction.consensus_data.validators[: n - 1]
                     + context.validation_results
                 )
 
             if majority_agrees:
-                return AcceptedState()
+                return ACCEPTED_STATE
 
             else:
                 # Appeal succeeded, set the status to PENDING and reset the appeal_failed counter
-                context.transactions_processor.set_transaction_result(
-                    context.transaction.hash, context.consensus_data.to_dict()
+                transactions_processor.set_transaction_result(
+                    transaction_hash, context.consensus_data.to_dict()
                 )
 
-                context.transactions_processor.set_transaction_appeal_failed(
-                    context.transaction.hash,
+                transactions_processor.set_transaction_appeal_failed(
+                    transaction_hash,
                     0,
                 )
-                context.transactions_processor.update_consensus_history(
-                    context.transaction.hash,
+                transactions_processor.update_consensus_history(
+                    transaction_hash,
                     "Validator Appeal Successful",
                     None,
                     context.validation_results,
                 )
 
                 # Reset the appeal processing time
-                context.transactions_processor.reset_transaction_appeal_processing_time(
-                    context.transaction.hash
+                transactions_processor.reset_transaction_appeal_processing_time(
+                    transaction_hash
                 )
-                context.transactions_processor.set_transaction_timestamp_appeal(
-                    context.transaction.hash, None
+                transactions_processor.set_transaction_timestamp_appeal(
+                    transaction_hash, None
                 )
 
-                return "validator_appeal_success"
+                return AppealSuccess.VALIDATOR
 
         else:
             # Not appealed, update consensus data with current votes and validators
@@ -1954,62 +2236,62 @@ class RevealingState(TransactionState):
             context.consensus_data.validators = context.validation_results
 
             if majority_agrees:
-                return AcceptedState()
+                return ACCEPTED_STATE
 
             # If all rotations are done and no consensus is reached, transition to UndeterminedState
-            elif context.rotation_count >= context.transaction.config_rotation_rounds:
-                return UndeterminedState()
+            elif context.rotation_count >= transaction.config_rotation_rounds:
+                return UNDETERMINED_STATE
 
             else:
-                used_leader_addresses = (
-                    ConsensusAlgorithm.get_used_leader_addresses_from_consensus_history(
-                        context.transactions_processor.get_transaction_by_hash(
-                            context.transaction.hash
-                        )["consensus_history"],
-                        context.consensus_data.leader_receipt[0],
+                # A validator only stops being a current validator by becoming a leader, so the not used
+                # validators are computed on the first rotation and only lose the validator added at each rotation
+                if context.not_used_validators is None:
+                    assert context.all_validators is not None
+                    context.not_used_validators = ConsensusAlgorithm.get_not_used_validators(
+                        context.all_validators,
+                        context.remaining_validators,
+                        ConsensusAlgorithm.get_used_leader_addresses_from_consensus_history(
+                            transactions_processor.get_transaction_consensus_history(
+                                transaction_hash
+                            ),
+                            context.consensus_data.leader_receipt[0],
+                        ),
                     )
-                )
                 # Add a new validator to the list of current validators when a rotation happens
                 try:
-                    assert context.validators_snapshot is not None
-                    old_validators = [
-                        x.validator.to_dict() for x in context.validators_snapshot.nodes
-                    ]
-
                     context.involved_validators = ConsensusAlgorithm.add_new_validator(
-                        old_validators,
+                        context.not_used_validators,
                         context.remaining_validators,
-                        used_leader_addresses,
                     )
                 except ValueError as e:
                     # No more validators
-                    context.msg_handler.send_message(
+                    context.msg_handler.enqueue(
                         LogEvent(
                             "consensus_event",
                             EventType.ERROR,
                             EventScope.CONSENSUS,
                             str(e),
                             {
-                                "transaction_hash": context.transaction.hash,
+                                "transaction_hash": transaction_hash,
                             },
-                            transaction_hash=context.transaction.hash,
+                            transaction_hash=transaction_hash,
                         )
                     )
-                    return UndeterminedState()
+                    return UNDETERMINED_STATE
 
                 context.rotation_count += 1
 
                 # Log the failure to reach consensus and transition to ProposingState
-                context.msg_handler.send_message(
+                context.msg_handler.enqueue(
                     LogEvent(
                         "consensus_event",
                         EventType.INFO,
                         EventScope.CONSENSUS,
                         "Majority disagreement, rotating the leader",
                         {
-                            "transaction_hash": context.transaction.hash,
+                            "transaction_hash": transaction_hash,
                         },
-                        transaction_hash=context.transaction.hash,
+                        transaction_hash=transaction_hash,
                     )
                 )
 
@@ -2017,22 +2299,22 @@ class RevealingState(TransactionState):
                 context.consensus_service.emit_transaction_event(
                     "emitTransactionLeaderRotated",
                     context.consensus_data.leader_receipt[0].node_config,
-                    context.transaction.hash,
+                    transaction_hash,
                     context.involved_validators[0]["address"],
                 )
 
                 # Update the consensus history
-                if context.transaction.appeal_undetermined:
+                if transaction.appeal_undetermined:
                     consensus_round = "Leader Rotation Appeal"
                 else:
                     consensus_round = "Leader Rotation"
-                context.transactions_processor.update_consensus_history(
-                    context.transaction.hash,
+                transactions_processor.update_consensus_history(
+                    transaction_hash,
                     consensus_round,
                     context.consensus_data.leader_receipt,
                     context.validation_results,
                 )
-                return ProposingState()
+                return PROPOSING_STATE
 
 
 class AcceptedState(TransactionState):
@@ -2050,53 +2332,55 @@ class AcceptedState(TransactionState):
         Returns:
             None: The transaction is accepted.
         """
+        transaction = context.transaction
+        transaction_hash = transaction.hash
+        transactions_processor = context.transactions_processor
+
         # When appeal fails, the appeal window is not reset
-        if context.transaction.appeal_undetermined:
+        if transaction.appeal_undetermined:
             consensus_round = "Leader Appeal Successful"
-            context.transactions_processor.set_transaction_timestamp_awaiting_finalization(
-                context.transaction.hash
+            transactions_processor.set_transaction_timestamp_awaiting_finalization(
+                transaction_hash
             )
-            context.transactions_processor.reset_transaction_appeal_processing_time(
-                context.transaction.hash
+            transactions_processor.reset_transaction_appeal_processing_time(
+                transaction_hash
             )
-            context.transactions_processor.set_transaction_timestamp_appeal(
-                context.transaction.hash, None
+            transactions_processor.set_transaction_timestamp_appeal(
+                transaction_hash, None
             )
-            context.transaction.timestamp_appeal = None
-            context.transactions_processor.set_transaction_appeal_failed(
-                context.transaction.hash,
+            transaction.timestamp_appeal = None
+            transactions_processor.set_transaction_appeal_failed(
+                transaction_hash,
                 0,
             )
-        elif not context.transaction.appealed:
+        elif not transaction.appealed:
             consensus_round = "Accepted"
-            context.transactions_processor.set_transaction_timestamp_awaiting_finalization(
-                context.transaction.hash
+            transactions_processor.set_transaction_timestamp_awaiting_finalization(
+                transaction_hash
             )
         else:
             consensus_round = "Validator Appeal Failed"
             # Set the transaction appeal status to False
-            context.transactions_processor.set_transaction_appeal(
-                context.transaction.hash, False
-            )
+            transactions_processor.set_transaction_appeal(transaction_hash, False)
 
             # Increment the appeal processing time when the transaction was appealed
-            context.transactions_processor.set_transaction_appeal_processing_time(
-                context.transaction.hash
+            transactions_processor.set_transaction_appeal_processing_time(
+                transaction_hash
             )
 
             # Appeal failed, increment the appeal_failed counter
-            context.transactions_processor.set_transaction_appeal_failed(
-                context.transaction.hash,
-                context.transaction.appeal_failed + 1,
+            transactions_processor.set_transaction_appeal_failed(
+                transaction_hash,
+                transaction.appeal_failed + 1,
             )
 
         # Set the transaction result
-        context.transactions_processor.set_transaction_result(
-            context.transaction.hash, context.consensus_data.to_dict()
+        transactions_processor.set_transaction_result(
+            transaction_hash, context.consensus_data.to_dict()
         )
 
-        context.transactions_processor.update_consensus_history(
-            context.transaction.hash,
+        transactions_processor.update_consensus_history(
+            transaction_hash,
             consensus_round,
             (
                 None
@@ -2109,25 +2393,25 @@ class AcceptedState(TransactionState):
 
         # Update the transaction status to ACCEPTED
         ConsensusAlgorithm.dispatch_transaction_status_update(
-            context.transactions_processor,
-            context.transaction.hash,
+            transactions_processor,
+            transaction_hash,
             TransactionStatus.ACCEPTED,
             context.msg_handler,
             False,
         )
 
         # Send a message indicating consensus was reached
-        context.msg_handler.send_message(
+        context.msg_handler.enqueue(
             LogEvent(
                 "consensus_event",
                 EventType.SUCCESS,
                 EventScope.CONSENSUS,
                 "Reached consensus",
                 {
-                    "transaction_hash": context.transaction.hash,
+                    "transaction_hash": transaction_hash,
                     "consensus_data": context.consensus_data.to_dict(),
                 },
-                transaction_hash=context.transaction.hash,
+                transaction_hash=transaction_hash,
             )
         )
 
@@ -2135,59 +2419,59 @@ class AcceptedState(TransactionState):
         leader_receipt = context.consensus_data.leader_receipt[0]
 
         # Do not deploy or update the contract if validator appeal failed
-        if not context.transaction.appealed:
+        if not transaction.appealed:
             # Set the contract snapshot for the transaction for a future rollback
-            if not context.transaction.contract_snapshot:
-                context.transactions_processor.set_transaction_contract_snapshot(
-                    context.transaction.hash, context.contract_snapshot.to_dict()
+            if not transaction.contract_snapshot:
+                transactions_processor.set_transaction_contract_snapshot(
+                    transaction_hash, context.contract_snapshot.to_dict()
                 )
 
             # Do not deploy or update the contract if the execution failed
             if leader_receipt.execution_result == ExecutionResultStatus.SUCCESS:
                 # Register contract if it is a new contract
-                if context.transaction.type == TransactionType.DEPLOY_CONTRACT:
+                if transaction.type == TransactionType.DEPLOY_CONTRACT:
                     new_contract = {
-                        "id": context.transaction.data["contract_address"],
+                        "id": transaction.data["contract_address"],
                         "data": {
                             "state": {
                                 "accepted": leader_receipt.contract_state,
                                 "finalized": {},
                             },
-                            "code": context.transaction.data["contract_code"],
+                            "code": transaction.data["contract_code"],
                         },
                     }
                     try:
                         context.contract_processor.register_contract(new_contract)
 
                         # Send a message indicating successful contract deployment
-                        context.msg_handler.send_message(
+                        context.msg_handler.enqueue(
                             LogEvent(
                                 "deployed_contract",
                                 EventType.SUCCESS,
                                 EventScope.GENVM,
                                 "Contract deployed",
                                 new_contract,
-                                transaction_hash=context.transaction.hash,
+                                transaction_hash=transaction_hash,
                             )
                         )
                     except Exception as e:
                         # Log the error but continue with the transaction processing
-                        context.msg_handler.send_message(
+                        context.msg_handler.enqueue(
                             LogEvent(
                                 "consensus_event",
                                 EventType.ERROR,
                                 EventScope.CONSENSUS,
                                 "Failed to register contract",
                                 {
-                                    "transaction_hash": context.transaction.hash,
+                                    "transaction_hash": transaction_hash,
                                 },
-                                transaction_hash=context.transaction.hash,
+                                transaction_hash=transaction_hash,
                             )
                         )
                 # Update contract state if it is an existing contract
                 else:
                     context.contract_processor.update_contract_state(
-                        context.transaction.to_address,
+                        transaction.to_address,
                         accepted_state=leader_receipt.contract_state,
                     )
 
@@ -2200,29 +2484,29 @@ class AcceptedState(TransactionState):
                 rollup_receipt = context.consensus_service.emit_transaction_event(
                     "emitTransactionAccepted",
                     leader_receipt.node_config,
-                    context.transaction.hash,
+                    transaction_hash,
                     internal_messages_data,
                 )
 
                 _emit_messages(context, insert_transactions_data, rollup_receipt)
 
         else:
-            context.transaction.appealed = False
+            transaction.appealed = False
 
             context.consensus_service.emit_transaction_event(
                 "emitTransactionAccepted",
                 leader_receipt.node_config,
-                context.transaction.hash,
+                transaction_hash,
                 [],
             )
 
         # Set the transaction appeal undetermined status to false and return appeal status
-        if context.transaction.appeal_undetermined:
-            context.transactions_processor.set_transaction_appeal_undetermined(
-                context.transaction.hash, False
+        if transaction.appeal_undetermined:
+            transactions_processor.set_transaction_appeal_undetermined(
+                transaction_hash, False
             )
-            context.transaction.appeal_undetermined = False
-            return "leader_appeal_success"
+            transaction.appeal_undetermined = False
+            return AppealSuccess.LEADER
         else:
             return None
 
@@ -2243,7 +2527,7 @@ class UndeterminedState(TransactionState):
             None: The transaction remains in an undetermined state.
         """
         # Send a message indicating consensus failure
-        context.msg_handler.send_message(
+        context.msg_handler.enqueue(
             LogEvent(
                 "consensus_event",
                 EventType.ERROR,
@@ -2376,6 +2660,132 @@ class FinalizingState(TransactionState):
             )
 
 
+# States hold no transaction data, every transition reuses the same instances
+PENDING_STATE = PendingState()
+PROPOSING_STATE = ProposingState()
+ACTIVATING_PROPOSING_STATE = ProposingState(activate=True)
+COMMITTING_STATE = CommittingState()
+REVEALING_STATE = RevealingState()
+ACCEPTED_STATE = AcceptedState()
+UNDETERMINED_STATE = UndeterminedState()
+FINALIZING_STATE = FinalizingState()
+
+
+async def _run_with_semaphore(semaphore: asyncio.Semaphore, coroutine: Awaitable):
+    """
+    Await the coroutine once the semaphore is acquired.
+
+    Args:
+        semaphore (asyncio.Semaphore): Semaphore bounding the number of coroutines running at the same time.
+        coroutine (Awaitable): The coroutine to run.
+
+    Returns:
+        The result of the coroutine.
+    """
+    async with semaphore:
+        return await coroutine
+
+
+@lru_cache(maxsize=1024)
+def _get_appeal_validators_split(
+    nb_current_validators: int, appeal_failed: int
+) -> tuple[int | None, int]:
+    """
+    Compute how the validators of an appeal are built, see ConsensusAlgorithm.get_extra_validators for the formula.
+
+    Args:
+        nb_current_validators (int): Number of validators of the current round, including the leader.
+        appeal_failed (int): Number of times the appeal has failed.
+
+    Returns:
+        int | None: Index in the current validators (leader excluded) from which they are reused, None when none are reused.
+        int: Number of extra validators to select.
+    """
+    if appeal_failed == 0:
+        # Calculate extra validators when no appeal has failed
+        return None, nb_current_validators + 2
+
+    if appeal_failed == 1:
+        # Calculate extra validators when one appeal has failed
+        n = (nb_current_validators - 2) // 2
+        return n - 1, n + 1
+
+    # Calculate extra validators when more than one appeal has failed
+    n = (nb_current_validators - 3) // (2 * appeal_failed - 1)
+    return n - 1, 2 * n
+
+
+def _get_transaction_status_update_event(
+    transaction_hash: str, new_status: TransactionStatus
+) -> LogEvent:
+    """
+    Build the message indicating a transaction status update.
+
+    Args:
+        transaction_hash (str): Hash of the transaction.
+        new_status (TransactionStatus): New status of the transaction.
+
+    Returns:
+        LogEvent: The transaction_status_updated event.
+    """
+    hash_value = str(transaction_hash)
+    status_value = str(new_status.value)
+    return LogEvent(
+        "transaction_status_updated",
+        EventType.INFO,
+        EventScope.CONSENSUS,
+        f"{status_value} {hash_value}",
+        {
+            "hash": hash_value,
+            "new_status": status_value,
+        },
+        transaction_hash=transaction_hash,
+    )
+
+
+def _emit_appeal_failed(msg_handler: MessageHandler, transaction_hash: str):
+    """
+    Notify that an appeal failed because no validators were found to process it, and that the appeal flag was reset.
+
+    Args:
+        msg_handler (MessageHandler): Handler for messaging.
+        transaction_hash (str): Hash of the appealed transaction.
+    """
+    msg_handler.enqueue(
+        APPEAL_FAILED_EVENT(
+            {
+                "transaction_hash": transaction_hash,
+            },
+            transaction_hash=transaction_hash,
+        )
+    )
+    msg_handler.enqueue(
+        log_event=APPEAL_UPDATED_EVENT(
+            {
+                "hash": transaction_hash,
+            },
+        ),
+        log_to_terminal=False,
+    )
+
+
+@lru_cache(maxsize=128)
+def _get_finality_window_reduction_factor(
+    appeal_failed: int, appeal_failed_reduction: float
+) -> float:
+    """
+    Compute the factor applied to the finality window after failed appeals.
+
+    Args:
+        appeal_failed (int): Number of times the appeal has failed.
+        appeal_failed_reduction (float): Reduction of the finality window per failed appeal.
+
+    Returns:
+        float: The factor to multiply the finality window time with.
+    """
+    return (1 - appeal_failed_reduction) ** appeal_failed
+
+
 def _get_messages_data(
     context: TransactionContext,
     pending_transactions: Iterable[PendingTransaction],
@@ -2383,10 +2793,16 @@ def _get_messages_data(
 ):
     insert_transactions_data = []
     internal_messages_data = []
-    for pending_transaction in filter(lambda t: t.on == on, pending_transactions):
-        nonce = context.transactions_processor.get_transaction_count(
-            context.transaction.to_address
-        )
+    pending_transactions = [t for t in pending_transactions if t.on == on]
+    if not pending_transactions:
+        return internal_messages_data, insert_transactions_data
+
+    # The messages are inserted in order by _emit_messages, so each one takes the next nonce of the contract
+    base_nonce = context.transactions_processor.get_transaction_count(
+        context.transaction.to_address
+    )
+    for index, pending_transaction in enumerate(pending_transactions):
+        nonce = base_nonce + index
         data: dict
         transaction_type: TransactionType
         if pending_transaction.is_deploy():
@@ -2398,18 +2814,18 @@ def _get_messages_data(
                     context.accounts_manager.create_new_account().address
                 )
             else:
-                from eth_utils.crypto import keccak
-                from backend.node.types import Address
-                from backend.node.base import SIMULATOR_CHAIN_ID
-
-                arr = bytearray()
-                arr.append(1)
-                arr.extend(Address(context.transaction.to_address).as_bytes)
-                arr.extend(
-                    pending_transaction.salt_nonce.to_bytes(32, "big", signed=False)
+                # The preimage is built with a single join instead of growing a bytearray
+                preimage = b"".join(
+                    (
+                        b"\x01",
+                        Address(context.transaction.to_address).as_bytes,
+                        pending_transaction.salt_nonce.to_bytes(
+                            32, "big", signed=False
+                        ),
+                        SIMULATOR_CHAIN_ID_BYTES,
+                    )
                 )
-                arr.extend(SIMULATOR_CHAIN_ID.to_bytes(32, "big", signed=False))
-                new_contract_address = Address(keccak(arr)[:20]).as_hex
+                new_contract_address = Address(keccak(preimage)[:20]).as_hex
                 context.accounts_manager.create_new_account_with_address(
                     new_contract_address
                 )
@@ -13,6 +13,14 @@ def get_validators_for_transaction(
     """
     num_validators = min(num_validators, len(nodes))
 
+    if num_validators == 1:
+        # A single weighted draw (leader rotation) does not need sampling without replacement
+        cumulative_stakes = np.cumsum([validator["stake"] for validator in nodes])
+        index = np.searchsorted(
+            cumulative_stakes, rng.random() * cumulative_stakes[-1], side="right"
+        )
+        return [nodes[index]]
+
     total_stake = sum(validator["stake"] for validator in nodes)
     probabilities = [validator["stake"] / total_stake for validator in nodes]
 
@@ -6,7 +6,10 @@ from eth_utils import is_address
 from .models import CurrentState
 from backend.database_handler.errors import AccountNotFoundError
 
+from sqlalchemy import func, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
 
 
 class AccountsManager:
@@ -80,3 +83,48 @@ class AccountsManager:
             self.create_new_account_with_address(account_address)
             to_account = self.get_account(account_address)
         to_account.balance = new_balance
+
+    def transfer(
+        self, from_address: str | None, to_address: str | None, value: int
+    ) -> bool:
+        """
+        Move value from one account to another without reading the balances first. A None from_address funds
+        the recipient and a None to_address burns the value. The recipient account is created if needed.
+
+        Returns:
+            bool: False if the sender balance is insufficient, in which case no balance is changed.
+        """
+        if from_address is not None:
+            # The balance check and the debit are a single conditional UPDATE
+            debited = self.session.execute(
+                update(CurrentState)
+                .where(CurrentState.id == from_address, CurrentState.balance >= value)
+                .values(balance=CurrentState.balance - value)
+                .execution_options(synchronize_session="fetch")
+            ).rowcount
+            if debited == 0 and value > 0:
+                return False
+
+        if to_address is not None:
+            if not is_address(to_address):
+                raise ValueError(f"Invalid address: {to_address}")
+            insert_statement = insert(CurrentState).values(
+                id=to_address, data="{}", balance=value
+            )
+            # The upsert skips the column onupdate and the identity map, both are handled here
+            self.session.execute(
+                insert_statement.on_conflict_do_update(
+                    index_elements=[CurrentState.id],
+                    set_={
+                        "balance": CurrentState.balance + value,
+                        "updated_at": func.current_timestamp(),
+                    },
+                )
+            )
+            to_account = self.session.identity_map.get(
+                identity_key(CurrentState, to_address)
+            )
+            if to_account is not None:
+                self.session.expire(to_account, ["balance", "updated_at"])
+
+        return True
@@ -14,13 +14,10 @@ from backend.database_handler.validators_registry import ValidatorsRegistry
 
 class ChainSnapshot:
     def __init__(self, session: Session):
+        # Transactions are loaded on first access, the pending transaction loop builds a snapshot per transaction without reading it
         self.session = session
-        self.pending_transactions = self._load_pending_transactions()
-        self.accepted_undetermined_transactions = (
-            self._load_accepted_undetermined_transactions()
-        )
-
-        del self.session
+        self.pending_transactions: List[dict] | None = None
+        self.accepted_undetermined_transactions: dict[str, List[dict]] | None = None
 
     def _load_pending_transactions(self) -> List[dict]:
         """Load and return the list of pending transactions from the database."""
@@ -38,6 +35,8 @@ class ChainSnapshot:
 
     def get_pending_transactions(self):
         """Return the list of pending transactions."""
+        if self.pending_transactions is None:
+            self.pending_transactions = self._load_pending_transactions()
         return self.pending_transactions
 
     def _load_accepted_undetermined_transactions(self) -> dict[str, List[dict]]:
@@ -65,4 +64,8 @@ class ChainSnapshot:
 
     def get_accepted_undetermined_transactions(self):
         """Return the list of accepted and undetermined transactions."""
+        if self.accepted_undetermined_transactions is None:
+            self.accepted_undetermined_transactions = (
+                self._load_accepted_undetermined_transactions()
+            )
         return self.accepted_undetermined_transactions
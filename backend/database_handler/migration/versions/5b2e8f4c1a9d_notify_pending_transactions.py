@@ -0,0 +1,55 @@
+"""notify pending transactions
+
+Revision ID: 5b2e8f4c1a9d
+Revises: c3f1a7d2e5b8
+Create Date: 2025-05-07 09:41:18.206734
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b2e8f4c1a9d"
+down_revision: Union[str, None] = "c3f1a7d2e5b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The payload is empty so Postgres folds the notifications of one database transaction into a single one,
+    # the crawler only needs to be woken up and then claims the pending rows itself
+    op.execute(
+        sa.text(
+            """
+            CREATE OR REPLACE FUNCTION notify_pending_transaction() RETURNS trigger AS $$
+            BEGIN
+                PERFORM pg_notify('pending_tx', '');
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+            """
+        )
+    )
+    # Notifications are delivered on commit, rows reset to pending by a rollback wake the crawler as well
+    op.execute(
+        sa.text(
+            """
+            CREATE TRIGGER transactions_notify_pending
+            AFTER INSERT OR UPDATE OF status ON transactions
+            FOR EACH ROW
+            WHEN (NEW.status = 'PENDING')
+            EXECUTE FUNCTION notify_pending_transaction()
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        sa.text("DROP TRIGGER IF EXISTS transactions_notify_pending ON transactions")
+    )
+    op.execute(sa.text("DROP FUNCTION IF EXISTS notify_pending_transaction()"))
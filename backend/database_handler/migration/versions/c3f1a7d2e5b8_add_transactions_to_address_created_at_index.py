@@ -0,0 +1,42 @@
+"""add transactions to_address created_at index
+
+Revision ID: c3f1a7d2e5b8
+Revises: 99015c5b5b78
+Create Date: 2025-05-06 10:12:31.482915
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f1a7d2e5b8"
+down_revision: Union[str, None] = "99015c5b5b78"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # `hash` is the primary key and already indexed, only the lookup of newer transactions per contract needs a new index
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_transactions_to_address_created_at",
+            "transactions",
+            ["to_address", "created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_transactions_to_address_created_at",
+            table_name="transactions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -6,6 +6,7 @@ from sqlalchemy import (
     CheckConstraint,
     DateTime,
     Enum,
+    Index,
     Integer,
     PrimaryKeyConstraint,
     String,
@@ -69,6 +70,7 @@ class Transactions(Base):
         CheckConstraint("type = ANY (ARRAY[0, 1, 2])", name="transactions_type_check"),
         PrimaryKeyConstraint("hash", name="transactions_pkey"),
         CheckConstraint("value >= 0", name="value_unsigned_int"),
+        Index("idx_transactions_to_address_created_at", "to_address", "created_at"),
     )
 
     hash: Mapped[str] = mapped_column(String(66), primary_key=True, unique=True)
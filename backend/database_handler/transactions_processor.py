@@ -7,8 +7,9 @@ from enum import Enum
 import rlp
 import re
 
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, desc
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import or_, desc, case, func, literal, select, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm.attributes import flag_modified
 from eth_utils import to_bytes, keccak, is_address
 from web3 import Web3
@@ -249,6 +250,54 @@ class TransactionsProcessor:
 
         return self._parse_transaction_data(transaction)
 
+    def get_statuses_by_hashes(self, transaction_hashes: list[str]) -> dict[str, str]:
+        if not transaction_hashes:
+            return {}
+
+        rows = (
+            self.session.query(Transactions.hash, Transactions.status)
+            .filter(Transactions.hash.in_(transaction_hashes))
+            .all()
+        )
+
+        return {transaction_hash: status.value for transaction_hash, status in rows}
+
+    def claim_pending_transactions(
+        self, limit: int, excluded_addresses: list[str] | None = None
+    ) -> list[dict]:
+        """
+        Fetch up to limit pending transactions in creation order with one query. Rows locked by another
+        session are skipped instead of waited on, and transactions to excluded_addresses are left out.
+        """
+        query = self.session.query(Transactions).filter(
+            Transactions.status == TransactionStatus.PENDING
+        )
+        if excluded_addresses:
+            # NOT IN is never true for a NULL to_address, those transactions are kept explicitly
+            query = query.filter(
+                or_(
+                    Transactions.to_address.is_(None),
+                    Transactions.to_address.not_in(excluded_addresses),
+                )
+            )
+        pending_transactions = (
+            query.order_by(Transactions.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        return [
+            self._parse_transaction_data(transaction)
+            for transaction in pending_transactions
+        ]
+
+    def get_transaction_consensus_history(self, transaction_hash: str) -> dict | None:
+        return (
+            self.session.query(Transactions.consensus_history)
+            .filter_by(hash=transaction_hash)
+            .scalar()
+        )
+
     def update_transaction_status(
         self,
         transaction_hash: str,
@@ -277,6 +326,103 @@ class TransactionsProcessor:
 
         self.session.commit()
 
+    @staticmethod
+    def _consensus_history_with_status_change(new_status: TransactionStatus):
+        """
+        SQL expression appending new_status to the current_status_changes of the consensus history,
+        the same status change tracking as update_transaction_status.
+        """
+        consensus_history = case(
+            (
+                func.jsonb_typeof(Transactions.consensus_history) == "object",
+                Transactions.consensus_history,
+            ),
+            else_=literal({}, JSONB),
+        )
+        current_status_changes = case(
+            (
+                Transactions.consensus_history.has_key("current_status_changes"),
+                Transactions.consensus_history["current_status_changes"].op("||")(
+                    literal([new_status.value], JSONB)
+                ),
+            ),
+            else_=literal([TransactionStatus.PENDING.value, new_status.value], JSONB),
+        )
+        return consensus_history.op("||")(
+            func.jsonb_build_object("current_status_changes", current_status_changes)
+        )
+
+    def update_transactions_status(
+        self, transaction_hashes: list[str], new_status: TransactionStatus
+    ):
+        """
+        Set the status of several transactions with a single UPDATE, tracking the change like update_transaction_status.
+        """
+        if not transaction_hashes:
+            return
+
+        self.session.execute(
+            update(Transactions)
+            .where(Transactions.hash.in_(transaction_hashes))
+            .values(
+                status=new_status,
+                consensus_history=self._consensus_history_with_status_change(
+                    new_status
+                ),
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+        self.session.commit()
+
+    def reset_newer_transactions_to_pending(
+        self, transaction_hash: str, include_transaction: bool = False
+    ) -> list[str]:
+        """
+        Set all transactions of the same contract created after the given one back to PENDING and clear their
+        contract snapshot with a single UPDATE, without loading the rows. The given transaction is looked up in a subquery
+        and is reset as well when include_transaction is True. The caller commits, so the reset can be part of a larger rollback.
+
+        Returns:
+            list[str]: Hashes of the reset transactions, ordered by creation time.
+        """
+        reference = aliased(Transactions)
+        created_at = (
+            select(reference.created_at)
+            .where(reference.hash == transaction_hash)
+            .scalar_subquery()
+        )
+
+        reset_transactions = self.session.execute(
+            update(Transactions)
+            .where(
+                Transactions.to_address
+                == select(reference.to_address)
+                .where(reference.hash == transaction_hash)
+                .scalar_subquery(),
+                (
+                    Transactions.created_at >= created_at
+                    if include_transaction
+                    else Transactions.created_at > created_at
+                ),
+            )
+            .values(
+                status=TransactionStatus.PENDING,
+                contract_snapshot=None,
+                consensus_history=self._consensus_history_with_status_change(
+                    TransactionStatus.PENDING
+                ),
+            )
+            .returning(Transactions.hash, Transactions.created_at)
+            .execution_options(synchronize_session="fetch")
+        ).all()
+
+        return [
+            reset_transaction.hash
+            for reset_transaction in sorted(
+                reset_transactions, key=lambda row: row.created_at
+            )
+        ]
+
     def set_transaction_result(
         self, transaction_hash: str, consensus_data: dict | None
     ):
@@ -336,6 +482,31 @@ class TransactionsProcessor:
             self.set_transaction_timestamp_appeal(transaction, int(time.time()))
             self.session.commit()
 
+    def reset_transaction_appeal(
+        self,
+        transaction_hash: str,
+        appeal_undetermined: bool | None = None,
+        update_appeal_processing_time: bool = False,
+    ):
+        """
+        Set appealed to False together with the other appeal columns that change when an appeal is picked up, in a single UPDATE.
+        """
+        values = {"appealed": False}
+        if appeal_undetermined is not None:
+            values["appeal_undetermined"] = appeal_undetermined
+        if update_appeal_processing_time:
+            values["appeal_processing_time"] = (
+                Transactions.appeal_processing_time
+                + round(time.time())
+                - Transactions.timestamp_appeal
+            )
+        self.session.execute(
+            update(Transactions)
+            .where(Transactions.hash == transaction_hash)
+            .values(**values)
+        )
+        self.session.commit()
+
     def set_transaction_timestamp_awaiting_finalization(
         self, transaction_hash: str, timestamp_awaiting_finalization: int = None
     ):
@@ -568,3 +739,33 @@ class TransactionsProcessor:
             if closest_transaction
             else None
         )
+
+    def get_previous_transaction_status(self, transaction_hash: str) -> dict | None:
+        transaction = (
+            self.session.query(Transactions.to_address, Transactions.created_at)
+            .filter_by(hash=transaction_hash)
+            .one()
+        )
+
+        closest_transaction = (
+            self.session.query(
+                Transactions.status,
+                Transactions.appealed,
+                Transactions.appeal_undetermined,
+            )
+            .filter(
+                Transactions.created_at < transaction.created_at,
+                Transactions.to_address == transaction.to_address,
+            )
+            .order_by(desc(Transactions.created_at))
+            .first()
+        )
+
+        if closest_transaction is None:
+            return None
+
+        return {
+            "status": closest_transaction.status.value,
+            "appealed": closest_transaction.appealed,
+            "appeal_undetermined": closest_transaction.appeal_undetermined,
+        }
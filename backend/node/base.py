@@ -241,7 +241,7 @@ class Node:
         msg_handler = self.msg_handler
         if msg_handler is None:
             return
-        msg_handler.send_message(
+        msg_handler.enqueue(
             LogEvent(
                 name="execution_finished",
                 type=(
@@ -647,7 +647,7 @@ def send_raw_transaction(
         tx_id = decoded_rollup_transaction.data.tx_id
         tx_id_hex = "0x" + tx_id.hex() if isinstance(tx_id, bytes) else tx_id
         transactions_processor.set_transaction_appeal(tx_id_hex, True)
-        msg_handler.send_message(
+        msg_handler.enqueue(
             log_event=LogEvent(
                 "transaction_appeal_updated",
                 EventType.INFO,
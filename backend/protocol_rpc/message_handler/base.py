@@ -1,6 +1,9 @@
 import os
 import json
+import threading
+from collections import deque
 from functools import wraps
+from typing import Iterable
 from logging.config import dictConfig
 import traceback
 
@@ -26,16 +29,53 @@ def get_client_session_id() -> str:
         return ""
 
 
+class _MessageQueue:
+    """
+    Unbounded queue of messages sent in order by a single background thread, shared by a message handler
+    and the handlers derived from it so all their queued messages keep one order.
+    """
+
+    def __init__(self):
+        self._messages: deque[tuple["MessageHandler", LogEvent, bool]] = deque()
+        self._messages_event = threading.Event()
+        self._drain_thread: threading.Thread | None = None
+        self._drain_thread_lock = threading.Lock()
+
+    def put_many(self, messages: Iterable[tuple["MessageHandler", LogEvent, bool]]):
+        self._messages.extend(messages)
+        if self._drain_thread is None:
+            with self._drain_thread_lock:
+                if self._drain_thread is None:
+                    self._drain_thread = threading.Thread(
+                        target=self._drain, daemon=True
+                    )
+                    self._drain_thread.start()
+        self._messages_event.set()
+
+    def _drain(self):
+        while True:
+            self._messages_event.wait()
+            self._messages_event.clear()
+            while self._messages:
+                msg_handler, log_event, log_to_terminal = self._messages.popleft()
+                try:
+                    msg_handler.send_message(log_event, log_to_terminal)
+                except Exception:
+                    traceback.print_exc()
+
+
 class MessageHandler:
     def __init__(self, socketio: SocketIO, config: GlobalConfiguration):
         self.socketio = socketio
         self.config = config
         self.client_session_id = None
+        self._message_queue = _MessageQueue()
         setup_logging_config()
 
     def with_client_session(self, client_session_id: str):
         new_msg_handler = MessageHandler(self.socketio, self.config)
         new_msg_handler.client_session_id = client_session_id
+        new_msg_handler._message_queue = self._message_queue
         return new_msg_handler
 
     def log_endpoint_info(self, func):
@@ -95,6 +135,42 @@ class MessageHandler:
             self._log_message(log_event)
         self._socket_emit(log_event)
 
+    def enqueue(self, log_event: LogEvent, log_to_terminal: bool = True):
+        """
+        Queue a message that is sent in order by a background thread, so the caller does not wait for logging and socket emission.
+        The queue is unbounded, no message is dropped when the thread falls behind. Events of a transaction must all be
+        queued, a message sent directly with send_message can overtake the queued ones.
+        """
+        self.enqueue_many((log_event,), log_to_terminal)
+
+    def enqueue_many(
+        self, log_events: Iterable[LogEvent], log_to_terminal: bool = True
+    ):
+        """
+        Queue several messages at once, the background thread is only woken up once for the whole batch.
+        """
+        # The request is only reachable from the caller's thread, resolve the session before the drain thread emits the message
+        client_session_id = self.client_session_id or get_client_session_id()
+        self._message_queue.put_many(
+            (
+                self,
+                _with_client_session_id(log_event, client_session_id),
+                log_to_terminal,
+            )
+            for log_event in log_events
+        )
+
+
+def _with_client_session_id(
+    log_event: LogEvent, client_session_id: str | None
+) -> LogEvent:
+    """
+    Set the client session of a message emitted to a session instead of a transaction room, if it has none yet.
+    """
+    if not log_event.transaction_hash and not log_event.client_session_id:
+        log_event.client_session_id = client_session_id
+    return log_event
+
 
 def log_endpoint_info_wrapper(msg_handler: MessageHandler, config: GlobalConfiguration):
     def decorator(func):
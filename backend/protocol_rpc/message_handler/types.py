@@ -15,7 +15,7 @@ class EventScope(Enum):
     CONSENSUS = "Consensus"
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEvent:
     name: str
     type: EventType
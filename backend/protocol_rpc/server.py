@@ -52,7 +52,14 @@ async def create_app():
         },  # recommended in https://docs.sqlalchemy.org/en/20/orm/session_basics.html#when-do-i-construct-a-session-when-do-i-commit-it-and-when-do-i-close-it
     )
 
-    engine = create_engine(db_uri, echo=True, pool_size=50, max_overflow=50)
+    # values_plus_batch also groups executemany UPDATE and DELETE statements into batches, not only INSERTs
+    engine = create_engine(
+        db_uri,
+        echo=True,
+        pool_size=50,
+        max_overflow=50,
+        executemany_mode="values_plus_batch",
+    )
 
     # Flask
     app = Flask("jsonrpc_api")
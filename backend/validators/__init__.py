@@ -76,6 +76,11 @@ class Snapshot:
 
     genvm_config_path: Path
 
+    # Validators given to consensus nodes, keyed by address and filled by node_factory on first use
+    node_validators: dict[str, domain.Validator] = dataclasses.field(
+        default_factory=dict, compare=False, repr=False
+    )
+
 
 class Manager:
     registry: vr.ModifiableValidatorsRegistry
@@ -119,3 +119,55 @@ def test_accounts_manager_update_timestamp(accounts_manager: AccountsManager):
     assert (
         second_datetime > first_datetime
     ), f"Expected {second_datetime} to be later than {first_datetime}"
+
+
+def test_transfer_insufficient_funds(accounts_manager: AccountsManager):
+    from_address = "0x9F0e84243496AcFB3Cd99D02eA59673c05901501"
+    to_address = "0xAcec3A6d871C25F591aBd4fC24054e524BBbF794"
+    accounts_manager.update_account_balance(from_address, 10)
+    accounts_manager.update_account_balance(to_address, 5)
+
+    assert accounts_manager.transfer(from_address, to_address, 20) is False
+
+    assert accounts_manager.get_account_balance(from_address) == 10
+    assert accounts_manager.get_account_balance(to_address) == 5
+
+
+def test_transfer_creates_recipient(accounts_manager: AccountsManager):
+    from_address = "0x9F0e84243496AcFB3Cd99D02eA59673c05901501"
+    to_address = "0xAcec3A6d871C25F591aBd4fC24054e524BBbF794"
+    accounts_manager.update_account_balance(from_address, 100)
+    assert accounts_manager.get_account(to_address) is None
+
+    assert accounts_manager.transfer(from_address, to_address, 30) is True
+
+    assert accounts_manager.get_account_balance(from_address) == 70
+    assert accounts_manager.get_account_balance(to_address) == 30
+
+
+def test_transfer_burn(accounts_manager: AccountsManager):
+    from_address = "0x9F0e84243496AcFB3Cd99D02eA59673c05901501"
+    accounts_manager.update_account_balance(from_address, 100)
+
+    assert accounts_manager.transfer(from_address, None, 40) is True
+
+    assert accounts_manager.get_account_balance(from_address) == 60
+
+
+def test_transfer_funding(accounts_manager: AccountsManager):
+    to_address = "0xAcec3A6d871C25F591aBd4fC24054e524BBbF794"
+
+    assert accounts_manager.transfer(None, to_address, 50) is True
+    assert accounts_manager.get_account_balance(to_address) == 50
+    accounts_manager.session.commit()
+
+    first_updated_at = accounts_manager.get_account(to_address).updated_at
+    time.sleep(0.1)
+
+    # The account is loaded in the session, the credit must not leave it stale
+    assert accounts_manager.transfer(None, to_address, 25) is True
+    accounts_manager.session.commit()
+
+    account = accounts_manager.get_account(to_address)
+    assert account.balance == 75
+    assert account.updated_at > first_updated_at
@@ -163,3 +163,146 @@ def test_get_highest_timestamp(transactions_processor: TransactionsProcessor):
 
     # Should return the highest timestamp (2000)
     assert transactions_processor.get_highest_timestamp() == 2000
+
+
+def test_reset_newer_transactions_to_pending(
+    transactions_processor: TransactionsProcessor,
+):
+    from_address = "0x9F0e84243496AcFB3Cd99D02eA59673c05901501"
+    to_address = "0xAcec3A6d871C25F591aBd4fC24054e524BBbF794"
+    other_to_address = "0x3F9Fb6C6aBaBD0Ae6cB27c513E7b0fE4C0B3E9C8"
+    data = {"key": "value"}
+
+    # Commit after each insert so every transaction gets a different created_at
+    transaction_hashes = []
+    for nonce in range(3):
+        transaction_hashes.append(
+            transactions_processor.insert_transaction(
+                from_address, to_address, data, 1.0, 1, nonce, True, 3
+            )
+        )
+        transactions_processor.session.commit()
+    other_transaction_hash = transactions_processor.insert_transaction(
+        from_address, other_to_address, data, 1.0, 1, 3, True, 3
+    )
+    transactions_processor.session.commit()
+
+    for transaction_hash in [*transaction_hashes, other_transaction_hash]:
+        transactions_processor.update_transaction_status(
+            transaction_hash, TransactionStatus.ACCEPTED
+        )
+        transactions_processor.set_transaction_contract_snapshot(
+            transaction_hash, {"contract_address": to_address}
+        )
+
+    reset_transaction_hashes = (
+        transactions_processor.reset_newer_transactions_to_pending(
+            transaction_hashes[0]
+        )
+    )
+
+    assert reset_transaction_hashes == transaction_hashes[1:]
+    for transaction_hash in reset_transaction_hashes:
+        transaction = transactions_processor.get_transaction_by_hash(transaction_hash)
+        assert transaction["status"] == TransactionStatus.PENDING.value
+        assert transaction["contract_snapshot"] is None
+        assert transaction["consensus_history"]["current_status_changes"] == [
+            TransactionStatus.PENDING.value,
+            TransactionStatus.ACCEPTED.value,
+            TransactionStatus.PENDING.value,
+        ]
+
+    for transaction_hash in (transaction_hashes[0], other_transaction_hash):
+        transaction = transactions_processor.get_transaction_by_hash(transaction_hash)
+        assert transaction["status"] == TransactionStatus.ACCEPTED.value
+
+
+def test_reset_newer_transactions_to_pending_include_transaction(
+    transactions_processor: TransactionsProcessor,
+):
+    from_address = "0x9F0e84243496AcFB3Cd99D02eA59673c05901501"
+    to_address = "0xAcec3A6d871C25F591aBd4fC24054e524BBbF794"
+    data = {"key": "value"}
+
+    transaction_hashes = []
+    for nonce in range(2):
+        transaction_hashes.append(
+            transactions_processor.insert_transaction(
+                from_address, to_address, data, 1.0, 1, nonce, True, 3
+            )
+        )
+        transactions_processor.session.commit()
+
+    for transaction_hash in transaction_hashes:
+        transactions_processor.update_transaction_status(
+            transaction_hash, TransactionStatus.ACCEPTED
+        )
+
+    reset_transaction_hashes = (
+        transactions_processor.reset_newer_transactions_to_pending(
+            transaction_hashes[0], include_transaction=True
+        )
+    )
+
+    assert reset_transaction_hashes == transaction_hashes
+    for transaction_hash in reset_transaction_hashes:
+        transaction = transactions_processor.get_transaction_by_hash(transaction_hash)
+        assert transaction["status"] == TransactionStatus.PENDING.value
+
+
+def test_update_transactions_status(transactions_processor: TransactionsProcessor):
+    from_address = "0x9F0e84243496AcFB3Cd99D02eA59673c05901501"
+    to_address = "0xAcec3A6d871C25F591aBd4fC24054e524BBbF794"
+    data = {"key": "value"}
+
+    transaction_hashes = []
+    for nonce in range(3):
+        transaction_hashes.append(
+            transactions_processor.insert_transaction(
+                from_address, to_address, data, 1.0, 1, nonce, True, 3
+            )
+        )
+        transactions_processor.session.commit()
+
+    transactions_processor.update_transactions_status(
+        transaction_hashes[:2], TransactionStatus.ACTIVATED
+    )
+
+    for transaction_hash in transaction_hashes[:2]:
+        transaction = transactions_processor.get_transaction_by_hash(transaction_hash)
+        assert transaction["status"] == TransactionStatus.ACTIVATED.value
+        assert transaction["consensus_history"]["current_status_changes"] == [
+            TransactionStatus.PENDING.value,
+            TransactionStatus.ACTIVATED.value,
+        ]
+
+    transaction = transactions_processor.get_transaction_by_hash(transaction_hashes[2])
+    assert transaction["status"] == TransactionStatus.PENDING.value
+
+
+def test_claim_pending_transactions_excluded_addresses(
+    transactions_processor: TransactionsProcessor,
+):
+    from_address = "0x9F0e84243496AcFB3Cd99D02eA59673c05901501"
+    to_address = "0xAcec3A6d871C25F591aBd4fC24054e524BBbF794"
+    excluded_address = "0x0000000000000000000000000000000000000001"
+    data = {"key": "value"}
+
+    excluded_hash = transactions_processor.insert_transaction(
+        from_address, excluded_address, data, 1.0, 1, 0, True, 3
+    )
+    transactions_processor.session.commit()
+    claimed_hash = transactions_processor.insert_transaction(
+        from_address, to_address, data, 1.0, 1, 1, True, 3
+    )
+    transactions_processor.session.commit()
+
+    claimed_transactions = transactions_processor.claim_pending_transactions(
+        10, [excluded_address]
+    )
+
+    assert [transaction["hash"] for transaction in claimed_transactions] == [
+        claimed_hash
+    ]
+    excluded_transaction = transactions_processor.get_transaction_by_hash(excluded_hash)
+    assert excluded_transaction["status"] == TransactionStatus.PENDING.value
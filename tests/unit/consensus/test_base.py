@@ -1,7 +1,12 @@
+import asyncio
+import threading
 import pytest
 from backend.database_handler.models import TransactionStatus
 from backend.node.types import Vote
-from backend.consensus.base import DEFAULT_VALIDATORS_COUNT
+from backend.consensus.base import (
+    DEFAULT_VALIDATORS_COUNT,
+    PENDING_TRANSACTIONS_BATCH_SIZE,
+)
 from tests.unit.consensus.test_helpers import (
     TransactionsProcessorMock,
     ContractDB,
@@ -1748,3 +1753,84 @@ async def test_exec_leader_appeal_succes_with_rollback_second_tx(consensus_algor
 
     finally:
         cleanup_threads(event, threads)
+
+
+@pytest.mark.asyncio
+async def test_crawl_snapshot_claims_several_batches(consensus_algorithm):
+    """
+    A backlog larger than one batch is claimed in a single crawl cycle instead of one batch per sleep interval,
+    transactions of a stopped queue at the front of the backlog are left pending without ending the cycle
+    """
+    stopped_transactions = [
+        init_dummy_transaction(f"stopped_transaction_hash_{i}") for i in range(3)
+    ]
+    for transaction in stopped_transactions:
+        transaction.to_address = "stopped_address"
+    transactions = [
+        init_dummy_transaction(f"transaction_hash_{i}")
+        for i in range(2 * PENDING_TRANSACTIONS_BATCH_SIZE + 1)
+    ]
+    transactions_processor = TransactionsProcessorMock(
+        [
+            transaction_to_dict(transaction)
+            for transaction in stopped_transactions + transactions
+        ]
+    )
+    # Same state as a queue being rolled back
+    queue_stop_event = asyncio.Event()
+    queue_stop_event.set()
+    consensus_algorithm.pending_queue_stop_events["stopped_address"] = queue_stop_event
+
+    stop_event = threading.Event()
+    crawl_task = asyncio.create_task(
+        consensus_algorithm._crawl_snapshot(
+            lambda session: transactions_processor, stop_event
+        )
+    )
+    try:
+        # Well below the sleep time, only the first crawl cycle can have run
+        await asyncio.sleep(consensus_algorithm.consensus_sleep_time / 4)
+        assert [
+            transaction["hash"]
+            for transaction in transactions_processor.get_pending_transactions()
+        ] == [transaction.hash for transaction in stopped_transactions]
+        assert consensus_algorithm.pending_queues["to_address"].qsize() == len(
+            transactions
+        )
+    finally:
+        stop_event.set()
+        await crawl_task
+
+
+@pytest.mark.asyncio
+async def test_exec_transaction_raises(consensus_algorithm):
+    """
+    A transaction whose execution raises is canceled instead of staying in an in-process status
+    """
+    transaction = init_dummy_transaction()
+    nodes = get_nodes_specs(3)
+    created_nodes = []
+    transactions_processor = TransactionsProcessorMock(
+        [transaction_to_dict(transaction)]
+    )
+
+    def get_vote():
+        raise Exception("Node failure")
+
+    event, *threads = setup_test_environment(
+        consensus_algorithm, transactions_processor, nodes, created_nodes, get_vote
+    )
+
+    try:
+        assert_transaction_status_match(
+            transactions_processor, transaction, [TransactionStatus.CANCELED.value]
+        )
+        assert transactions_processor.updated_transaction_status_history == {
+            "transaction_hash": [
+                TransactionStatus.ACTIVATED,
+                TransactionStatus.PROPOSING,
+                TransactionStatus.CANCELED,
+            ]
+        }
+    finally:
+        cleanup_threads(event, threads)
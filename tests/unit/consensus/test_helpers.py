@@ -36,6 +36,17 @@ class AccountsManagerMock:
     def update_account_balance(self, address: str, balance: int):
         self.accounts[address] = balance
 
+    def transfer(
+        self, from_address: str | None, to_address: str | None, value: int
+    ) -> bool:
+        if from_address is not None:
+            if self.accounts[from_address] < value:
+                return False
+            self.accounts[from_address] -= value
+        if to_address is not None:
+            self.accounts[to_address] += value
+        return True
+
 
 class TransactionsProcessorMock:
     def __init__(self, transactions=None):
@@ -50,6 +61,27 @@ class TransactionsProcessorMock:
                 return transaction
         raise ValueError(f"Transaction with hash {transaction_hash} not found")
 
+    def get_statuses_by_hashes(self, transaction_hashes: list[str]) -> dict[str, str]:
+        transaction_hashes = set(transaction_hashes)
+        return {
+            transaction["hash"]: transaction["status"]
+            for transaction in self.transactions
+            if transaction["hash"] in transaction_hashes
+        }
+
+    def claim_pending_transactions(
+        self, limit: int, excluded_addresses: list[str] | None = None
+    ) -> list[dict]:
+        excluded_addresses = set(excluded_addresses or ())
+        return [
+            transaction
+            for transaction in self.get_pending_transactions()
+            if transaction["to_address"] not in excluded_addresses
+        ][:limit]
+
+    def get_transaction_consensus_history(self, transaction_hash: str) -> dict:
+        return self.get_transaction_by_hash(transaction_hash)["consensus_history"]
+
     def update_transaction_status(
         self,
         transaction_hash: str,
@@ -74,11 +106,33 @@ class TransactionsProcessorMock:
 
             self.status_changed_event.set()
 
+    def update_transactions_status(
+        self, transaction_hashes: list[str], new_status: TransactionStatus
+    ):
+        for transaction_hash in transaction_hashes:
+            self.update_transaction_status(transaction_hash, new_status)
+
     def wait_for_status_change(self, timeout: float = 0.1) -> bool:
         result = self.status_changed_event.wait(timeout)
         self.status_changed_event.clear()
         return result
 
+    def reset_newer_transactions_to_pending(
+        self, transaction_hash: str, include_transaction: bool = False
+    ) -> list[str]:
+        transaction_hashes = [
+            transaction["hash"]
+            for transaction in self.get_newer_transactions(transaction_hash)
+        ]
+        if include_transaction:
+            transaction_hashes.insert(0, transaction_hash)
+        for newer_transaction_hash in transaction_hashes:
+            self.update_transaction_status(
+                newer_transaction_hash, TransactionStatus.PENDING
+            )
+            self.set_transaction_contract_snapshot(newer_transaction_hash, None)
+        return transaction_hashes
+
     def set_transaction_result(self, transaction_hash: str, consensus_data: dict):
         transaction = self.get_transaction_by_hash(transaction_hash)
         transaction["consensus_data"] = consensus_data
@@ -95,6 +149,20 @@ class TransactionsProcessorMock:
             time.sleep(1)
             transaction["appealed"] = appeal
 
+    def reset_transaction_appeal(
+        self,
+        transaction_hash: str,
+        appeal_undetermined: bool | None = None,
+        update_appeal_processing_time: bool = False,
+    ):
+        self.set_transaction_appeal(transaction_hash, False)
+        if appeal_undetermined is not None:
+            self.set_transaction_appeal_undetermined(
+                transaction_hash, appeal_undetermined
+            )
+        if update_appeal_processing_time:
+            self.set_transaction_appeal_processing_time(transaction_hash)
+
     def set_transaction_timestamp_awaiting_finalization(
         self, transaction_hash: str, timestamp_awaiting_finalization: int = None
     ):
@@ -222,6 +290,9 @@ class TransactionsProcessorMock:
     ) -> None:
         return None
 
+    def get_previous_transaction_status(self, transaction_hash: str) -> None:
+        return None
+
 
 class SnapshotMock:
     def __init__(self, transactions_processor: TransactionsProcessorMock):
@@ -494,6 +565,13 @@ def consensus_algorithm() -> ConsensusAlgorithm:
         def send_message(self, log_event, log_to_terminal: bool = True):
             print(log_event)
 
+        def enqueue(self, log_event, log_to_terminal: bool = True):
+            self.send_message(log_event, log_to_terminal)
+
+        def enqueue_many(self, log_events, log_to_terminal: bool = True):
+            for log_event in log_events:
+                self.send_message(log_event, log_to_terminal)
+
     # Mock the session and other dependencies
     mock_session = MagicMock()
     mock_msg_handler = MessageHandlerMock()
@@ -581,7 +659,7 @@ def setup_test_environment(
     async def start_all():
         futures = [
             consensus_algorithm.run_crawl_snapshot_loop(
-                chain_snapshot_factory, transactions_processor_factory, stop_event
+                transactions_processor_factory, stop_event
             ),
             consensus_algorithm.run_process_pending_transactions_loop(
                 chain_snapshot_factory,
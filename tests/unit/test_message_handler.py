@@ -0,0 +1,129 @@
+import threading
+from unittest.mock import Mock
+
+from flask import Flask
+
+from backend.protocol_rpc.message_handler.base import MessageHandler
+from backend.protocol_rpc.message_handler.types import EventScope, EventType, LogEvent
+
+
+def test_enqueue_sends_messages_in_order():
+    socketio = Mock()
+    msg_handler = MessageHandler(socketio, config=Mock())
+
+    all_sent = threading.Event()
+    emitted = []
+
+    def emit(name, data, room=None, to=None):
+        emitted.append(data["message"])
+        if len(emitted) == 3:
+            all_sent.set()
+
+    socketio.emit.side_effect = emit
+
+    for i in range(3):
+        msg_handler.enqueue(
+            LogEvent(
+                "consensus_event",
+                EventType.INFO,
+                EventScope.CONSENSUS,
+                f"message {i}",
+                transaction_hash="0x1",
+            ),
+            log_to_terminal=False,
+        )
+
+    assert all_sent.wait(timeout=5)
+    assert emitted == ["message 0", "message 1", "message 2"]
+
+
+def test_enqueue_many_sends_messages_in_order():
+    socketio = Mock()
+    msg_handler = MessageHandler(socketio, config=Mock())
+
+    all_sent = threading.Event()
+    emitted = []
+
+    def emit(name, data, room=None, to=None):
+        emitted.append(data["message"])
+        if len(emitted) == 4:
+            all_sent.set()
+
+    socketio.emit.side_effect = emit
+
+    def log_event(message: str) -> LogEvent:
+        return LogEvent(
+            "consensus_event",
+            EventType.INFO,
+            EventScope.CONSENSUS,
+            message,
+            transaction_hash="0x1",
+        )
+
+    msg_handler.enqueue(log_event("message 0"), log_to_terminal=False)
+    msg_handler.enqueue_many(
+        (log_event(f"message {i}") for i in range(1, 4)), log_to_terminal=False
+    )
+
+    assert all_sent.wait(timeout=5)
+    assert emitted == ["message 0", "message 1", "message 2", "message 3"]
+
+
+def test_client_session_handler_shares_the_message_order():
+    socketio = Mock()
+    msg_handler = MessageHandler(socketio, config=Mock())
+    client_msg_handler = msg_handler.with_client_session("session_id")
+
+    all_sent = threading.Event()
+    emitted = []
+
+    def emit(name, data, room=None, to=None):
+        emitted.append((data["message"], to))
+        if len(emitted) == 4:
+            all_sent.set()
+
+    socketio.emit.side_effect = emit
+
+    def log_event(message: str) -> LogEvent:
+        return LogEvent(
+            "consensus_event", EventType.INFO, EventScope.CONSENSUS, message
+        )
+
+    for i in range(4):
+        handler = client_msg_handler if i % 2 else msg_handler
+        handler.enqueue(log_event(f"message {i}"), log_to_terminal=False)
+
+    assert all_sent.wait(timeout=5)
+    assert [message for message, _ in emitted] == [f"message {i}" for i in range(4)]
+    # Each message is still emitted with the client session of the handler that queued it
+    assert emitted[1][1] == "session_id"
+    assert emitted[3][1] == "session_id"
+
+
+def test_enqueue_resolves_the_client_session_in_the_request():
+    socketio = Mock()
+    msg_handler = MessageHandler(socketio, config=Mock())
+
+    sent = threading.Event()
+    targets = []
+
+    def emit(name, data, room=None, to=None):
+        targets.append(to)
+        sent.set()
+
+    socketio.emit.side_effect = emit
+
+    app = Flask(__name__)
+    with app.test_request_context(headers={"x-session-id": "session_id"}):
+        msg_handler.enqueue(
+            LogEvent(
+                "transaction_appeal_updated",
+                EventType.INFO,
+                EventScope.CONSENSUS,
+                "Set transaction appealed",
+            ),
+            log_to_terminal=False,
+        )
+
+    assert sent.wait(timeout=5)
+    assert targets == ["session_id"]
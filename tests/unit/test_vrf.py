@@ -66,3 +66,18 @@ def test_get_validators_for_transaction_3():
 
     rng.choice.assert_called_once()
     assert validators == [{"stake": 3}, {"stake": 2}, {"stake": 1}]
+
+
+def test_get_validators_for_transaction_single():
+    """
+    Tests that selecting a single validator never returns a validator without stake
+    """
+    nodes = [{"stake": 0}, {"stake": 1}, {"stake": 0}, {"stake": 2}, {"stake": 0}]
+
+    accumulated = set()
+    while accumulated != {1, 2}:
+        validators = get_validators_for_transaction(nodes, 1)
+
+        assert len(validators) == 1
+        assert validators[0]["stake"] > 0
+        accumulated.add(validators[0]["stake"])